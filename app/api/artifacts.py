@@ -1,17 +1,31 @@
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Query
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
 from typing import Optional
-import json
-from app.models.metadata import Artifact, ArtifactStatus
+import asyncio
+import orjson
+from pydantic import ValidationError
+from bson.errors import InvalidId
+from app.models.metadata import ARTIFACT_CREATE_LIST_ADAPTER, Artifact, ArtifactStatus
 from app.models.ingestion import IngestionMetadata, IngestionResponse, ArtifactStatusResponse
-from app.factory import factory
+from app.factory import Factory, get_app_factory
+from app.api.caching import CACHE_CONTROL, document_etag, not_modified
+from app.api.responses import DocumentResponse, dumps_document
 
 router = APIRouter(prefix="/artifacts", tags=["artifacts"])
 
+MAX_BULK_ARTIFACTS = 1000
+
+# Metadata above this size is validated in a worker thread so large blobs
+# (embedded EXIF/technical arrays) don't stall the event loop
+METADATA_INLINE_PARSE_BYTES = 64 * 1024
+
 
 @router.post("/ingest", response_model=IngestionResponse)
 async def ingest_artifact(
     file: UploadFile = File(..., description="Artifact file to upload"),
     metadata: str = Form(..., description="JSON-encoded ingestion metadata"),
+    factory: Factory = Depends(get_app_factory),
 ):
     """
     Ingest a new artifact with file upload and metadata.
@@ -30,12 +44,16 @@ async def ingest_artifact(
         IngestionResponse with artifact ID and status
     """
     try:
-        # Parse metadata JSON
-        metadata_dict = json.loads(metadata)
-        ingestion_metadata = IngestionMetadata(**metadata_dict)
-    except json.JSONDecodeError:
-        raise HTTPException(status_code=400, detail="Invalid JSON in metadata field")
-    except Exception as e:
+        # Parse and validate metadata JSON in a single pass
+        if len(metadata) > METADATA_INLINE_PARSE_BYTES:
+            ingestion_metadata = await asyncio.to_thread(
+                IngestionMetadata.model_validate_json, metadata
+            )
+        else:
+            ingestion_metadata = IngestionMetadata.model_validate_json(metadata)
+    except ValidationError as e:
+        if any(error["type"] == "json_invalid" for error in e.errors()):
+            raise HTTPException(status_code=400, detail="Invalid JSON in metadata field")
         raise HTTPException(status_code=400, detail=f"Invalid metadata: {str(e)}")
 
     try:
@@ -50,7 +68,10 @@ async def ingest_artifact(
 
 
 @router.get("/{artifact_id}/status", response_model=ArtifactStatusResponse)
-async def get_artifact_status(artifact_id: str):
+async def get_artifact_status(
+    artifact_id: str,
+    factory: Factory = Depends(get_app_factory),
+):
     """
     Get the processing status of an artifact.
 
@@ -75,72 +96,188 @@ async def get_artifact_status(artifact_id: str):
 
 
 @router.get("/{artifact_id}")
-async def get_artifact(artifact_id: str):
+async def get_artifact(
+    artifact_id: str,
+    request: Request,
+    response: Response,
+    factory: Factory = Depends(get_app_factory),
+):
     """
     Get full artifact metadata by ID.
 
+    Supports If-None-Match; returns 304 when the client copy is current.
+    Reads are cached per server worker for up to 5 seconds, so a change
+    made through another worker may take that long to appear.
+
     Args:
         artifact_id: Artifact identifier
 
     Returns:
         Complete artifact document
     """
-    artifact = await factory.db.get_artifact(artifact_id)
+    artifact = await factory.db.get_artifact_with_id(artifact_id)
     if not artifact:
         raise HTTPException(status_code=404, detail="Artifact not found")
 
-    # Convert MongoDB ObjectId to string and rename _id to artifact_id
-    if "_id" in artifact:
-        artifact["artifact_id"] = str(artifact["_id"])
-        del artifact["_id"]
+    etag = document_etag(
+        artifact["artifact_id"],
+        artifact.get("updated_at") or artifact.get("created_at"),
+    )
+    cached = not_modified(request, response, etag)
+    if cached:
+        return cached
+
+    return DocumentResponse(
+        artifact, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    )
+
+
+async def _stream_artifacts_page(first: dict | None, cursor, limit: int, skip: int):
+    """
+    Stream a page of artifacts as a JSON envelope.
+    Each document is encoded as it arrives from the cursor, so the page is
+    never materialised as a list before the response is written.
+
+    The first document is fetched by the caller before the response starts;
+    that fetch runs the query and pulls the whole page (one batch), so query
+    errors are raised before any status or body has been sent.
+    """
+    yield b'{"limit":%s,"skip":%s,"artifacts":[' % (orjson.dumps(limit), orjson.dumps(skip))
+
+    count = 0
+    last_id = None
+    has_more = False
+    if first is not None:
+        async for artifact in _chain(first, cursor):
+            if count == limit:
+                # Extra document fetched only to detect another page
+                has_more = True
+                break
+
+            last_id = artifact["artifact_id"]
+            yield (b"," if count else b"") + dumps_document(artifact)
+            count += 1
 
-    return artifact
+    next_cursor = last_id if has_more else None
+    yield b'],"has_more":%s,"next_cursor":%s}' % (
+        orjson.dumps(has_more),
+        orjson.dumps(next_cursor),
+    )
+
+
+async def _chain(first: dict, cursor):
+    """Yield an already-fetched document, then the rest of the cursor."""
+    yield first
+    async for document in cursor:
+        yield document
 
 
 @router.get("/")
 async def list_artifacts(
     limit: Optional[int] = Query(50, ge=1, le=100, description="Maximum number of results"),
-    skip: Optional[int] = Query(0, ge=0, description="Number of results to skip"),
+    after: Optional[str] = Query(None, description="Cursor from a previous page (next_cursor)"),
+    skip: Optional[int] = Query(
+        0, ge=0, description="Number of results to skip (use after instead)", deprecated=True
+    ),
     status: Optional[ArtifactStatus] = Query(None, description="Filter by status"),
+    q: Optional[str] = Query(None, min_length=1, description="Full-text search over title and description"),
+    factory: Factory = Depends(get_app_factory),
 ):
     """
-    List artifacts with pagination and filtering.
+    List artifacts with cursor-based pagination and filtering.
+
+    The page is streamed as it is read from the database. The query runs
+    before the response starts, so database errors still return an error
+    status.
 
     Args:
         limit: Maximum number of artifacts to return (default 50, max 100)
-        skip: Number of artifacts to skip for pagination
+        after: Return artifacts after this cursor (next_cursor of the previous page)
+        skip: Number of artifacts to skip (deprecated, prefer after)
         status: Filter by artifact status
+        q: Full-text search over title and description (results stay in _id order)
 
     Returns:
-        List of artifacts
+        List of artifacts, whether more exist, and the cursor for the next page
     """
-    if status:
-        artifacts = await factory.db.get_artifacts_by_status(status)
-        # Apply pagination manually
-        artifacts = artifacts[skip : skip + limit]
-    else:
-        artifacts = await factory.db.get_artifacts(limit=limit, skip=skip)
-
-    # Convert MongoDB ObjectId to string and rename _id to artifact_id
-    for artifact in artifacts:
-        if "_id" in artifact:
-            artifact["artifact_id"] = str(artifact["_id"])
-            del artifact["_id"]
-
-    return {
-        "total": len(artifacts),
-        "limit": limit,
-        "skip": skip,
-        "artifacts": artifacts,
-    }
+    try:
+        cursor = await factory.db.find_artifacts_paged(
+            limit=limit, after=after, status=status, skip=skip, search=q
+        )
+        # Motor cursors are lazy: fetching the first document runs the query
+        # and pulls the first batch, which holds the whole page
+        first = await anext(cursor, None)
+    except InvalidId:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+    return StreamingResponse(
+        _stream_artifacts_page(first, cursor, limit, skip),
+        media_type="application/json",
+    )
 
 
 @router.post("/")
 async def new_artifact(
     artifact: Artifact,
+    factory: Factory = Depends(get_app_factory),
 ):
     """
     Legacy endpoint for creating artifacts directly (backwards compatibility).
     Consider using /ingest endpoint for new implementations.
     """
     return await factory.db.insert_artifact("artifacts", artifact)
+
+
+@router.post(
+    "/bulk",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": ARTIFACT_CREATE_LIST_ADAPTER.json_schema()}
+            },
+        }
+    },
+)
+async def new_artifacts(
+    request: Request,
+    factory: Factory = Depends(get_app_factory),
+):
+    """
+    Create many artifacts directly in one request (bulk import, reprocessing).
+
+    The JSON body (a list of ArtifactCreate objects, at most
+    MAX_BULK_ARTIFACTS) is decoded with orjson and its length checked before
+    any model is validated, so oversized batches are rejected cheaply; the
+    items are then validated with a prebuilt TypeAdapter. Each artifact is
+    created like a single one: status, version, fixity, storage locations
+    and events cannot be set by the caller.
+
+    Returns:
+        Dictionary with the artifact IDs in request order (null where the
+        insert failed) and the errors of failed inserts by request index
+    """
+    try:
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+
+    if isinstance(body, list) and len(body) > MAX_BULK_ARTIFACTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BULK_ARTIFACTS} artifacts can be created per request",
+        )
+
+    try:
+        artifacts = ARTIFACT_CREATE_LIST_ADAPTER.validate_python(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
+    if not artifacts:
+        return {"ids": [], "errors": []}
+
+    return await factory.db.insert_artifacts(
+        [Artifact.create(artifact) for artifact in artifacts]
+    )
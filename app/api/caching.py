@@ -0,0 +1,65 @@
+"""
+HTTP conditional-request helpers for polled read endpoints.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from fastapi import Request, Response
+
+# Lets polling frontends reuse a response briefly without revalidating
+CACHE_CONTROL = "private, max-age=5"
+
+
+def document_etag(doc_id: str, updated_at: datetime | str | None) -> str:
+    """
+    Build a weak ETag from a document's id and last-modified timestamp.
+
+    Every write path bumps updated_at, so the pair identifies a version.
+    Naive datetimes (as Mongo returns them) are taken as UTC. Legacy string
+    timestamps that do not parse are hashed as-is rather than rejected.
+
+    Args:
+        doc_id: Document identifier
+        updated_at: Last modification time (datetime or ISO string)
+
+    Returns:
+        Weak ETag header value
+    """
+    if isinstance(updated_at, str):
+        try:
+            # fromisoformat only accepts a trailing Z from Python 3.11
+            updated_at = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
+        except ValueError:
+            digest = hashlib.blake2b(updated_at.encode(), digest_size=8).hexdigest()
+            return f'W/"{doc_id}-{digest}"'
+
+    if not updated_at:
+        version = 0
+    else:
+        if updated_at.tzinfo is None:
+            updated_at = updated_at.replace(tzinfo=timezone.utc)
+        version = int(updated_at.timestamp() * 1_000_000)
+    return f'W/"{doc_id}-{version}"'
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Response | None:
+    """
+    Set caching headers and short-circuit when the client copy is current.
+
+    Args:
+        request: Incoming request
+        response: Response whose headers are sent with the body
+        etag: Current ETag of the resource
+
+    Returns:
+        A 304 response if If-None-Match matches, otherwise None
+    """
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip() for tag in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
@@ -2,7 +2,8 @@
 API endpoints for preservation collections.
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 from app.models.collection import (
     CollectionDraftRequest,
     CollectionDraftResponse,
@@ -10,7 +11,8 @@ from app.models.collection import (
     CollectionVerificationResult,
     Collection,
 )
-from app.factory import factory
+from app.factory import Factory, get_app_factory
+from app.api.caching import document_etag, not_modified
 import logging
 
 logger = logging.getLogger(__name__)
@@ -19,7 +21,10 @@ router = APIRouter(prefix="/collections", tags=["collections"])
 
 
 @router.post("/draft", response_model=CollectionDraftResponse)
-async def create_collection_draft(request: CollectionDraftRequest):
+async def create_collection_draft(
+    request: CollectionDraftRequest,
+    factory: Factory = Depends(get_app_factory),
+):
     """
     Create a new preservation collection draft.
 
@@ -71,7 +76,10 @@ async def create_collection_draft(request: CollectionDraftRequest):
 
 
 @router.post("/{collection_id}/finalize", response_model=CollectionVerificationResult)
-async def finalize_collection(collection_id: str):
+async def finalize_collection(
+    collection_id: str,
+    factory: Factory = Depends(get_app_factory),
+):
     """
     Verify and seal a collection after user upload.
 
@@ -113,11 +121,19 @@ async def finalize_collection(collection_id: str):
 
 
 @router.get("/{collection_id}", response_model=Collection)
-async def get_collection(collection_id: str):
+async def get_collection(
+    collection_id: str,
+    request: Request,
+    response: Response,
+    factory: Factory = Depends(get_app_factory),
+):
     """
     Get collection details by ID.
 
     Returns full collection metadata including verification status.
+    Supports If-None-Match; returns 304 when the client copy is current.
+    Reads are cached per server worker for up to 5 seconds, so a change
+    made through another worker may take that long to appear.
     """
     if not factory.collection_service:
         raise HTTPException(
@@ -129,6 +145,13 @@ async def get_collection(collection_id: str):
     if not collection:
         raise HTTPException(status_code=404, detail="Collection not found")
 
+    etag = document_etag(
+        collection.collection_id, collection.updated_at or collection.created_at
+    )
+    cached = not_modified(request, response, etag)
+    if cached:
+        return cached
+
     return collection
 
 
@@ -137,6 +160,7 @@ async def list_collections(
     status: CollectionStatus | None = Query(default=None, description="Filter by status"),
     limit: int = Query(default=50, ge=1, le=100, description="Maximum number of results"),
     skip: int = Query(default=0, ge=0, description="Number of results to skip"),
+    factory: Factory = Depends(get_app_factory),
 ):
     """
     List collections with optional filtering.
@@ -159,11 +183,13 @@ async def list_collections(
 
     try:
         collections, total = await factory.collection_service.list_collections(status, limit, skip)
-        return {
-            "collections": collections,
+        # Dump each model once and return the response directly so FastAPI
+        # doesn't walk the result again with jsonable_encoder
+        return ORJSONResponse({
+            "collections": [c.model_dump(mode="json") for c in collections],
             "count": len(collections),
             "total": total,
-        }
+        })
     except Exception as e:
         logger.error(f"Failed to list collections: {e}")
         raise HTTPException(status_code=500, detail=str(e))
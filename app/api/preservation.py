@@ -1,11 +1,16 @@
-from fastapi import APIRouter, HTTPException
-from app.factory import factory
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from app.models.metadata import StorageType
+from app.factory import Factory, get_app_factory
+from app.api.responses import DocumentResponse
 
 router = APIRouter(prefix="/preservation", tags=["preservation"])
 
 
 @router.get("/artifacts/{artifact_id}/events")
-async def get_preservation_events(artifact_id: str):
+async def get_preservation_events(
+    artifact_id: str,
+    factory: Factory = Depends(get_app_factory),
+):
     """
     Get all preservation events for an artifact.
 
@@ -26,7 +31,10 @@ async def get_preservation_events(artifact_id: str):
 
 
 @router.get("/artifacts/{artifact_id}/storage-locations")
-async def get_storage_locations(artifact_id: str):
+async def get_storage_locations(
+    artifact_id: str,
+    factory: Factory = Depends(get_app_factory),
+):
     """
     Get all storage locations for an artifact.
 
@@ -41,34 +49,91 @@ async def get_storage_locations(artifact_id: str):
     """
     try:
         locations = await factory.storage_location_service.get_locations(artifact_id)
-        return {
+        return DocumentResponse({
             "artifact_id": artifact_id,
             "locations": locations,
             "total_copies": len(locations),
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"Artifact not found: {str(e)}")
 
 
-@router.post("/artifacts/{artifact_id}/replicate")
-async def replicate_to_archive(artifact_id: str):
+@router.get("/artifacts/{artifact_id}/overview")
+async def get_preservation_overview(
+    artifact_id: str,
+    factory: Factory = Depends(get_app_factory),
+):
+    """
+    Get events, storage locations and fixity for an artifact in one call.
+
+    Combines the events, storage-locations and fixity endpoints for
+    artifact detail pages. All three live on the artifact document, so
+    they are read together with a single projected query.
+
+    Args:
+        artifact_id: Artifact identifier
+
+    Returns:
+        Preservation events, storage locations and fixity information
+    """
+    try:
+        artifact = await factory.db.get_artifact(
+            artifact_id,
+            projection={"preservation_events": 1, "storage_locations": 1, "fixity": 1},
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error retrieving artifact: {str(e)}")
+
+    if not artifact:
+        raise HTTPException(status_code=404, detail="Artifact not found")
+
+    locations = artifact.get("storage_locations", [])
+    return DocumentResponse({
+        "artifact_id": artifact_id,
+        "events": artifact.get("preservation_events", []),
+        "locations": locations,
+        "total_copies": len(locations),
+        "fixity": artifact.get("fixity"),
+    })
+
+
+@router.post("/artifacts/{artifact_id}/replicate", status_code=202)
+async def replicate_to_archive(
+    artifact_id: str,
+    background_tasks: BackgroundTasks,
+    factory: Factory = Depends(get_app_factory),
+):
     """
     Trigger replication of artifact from hot storage to archive.
 
-    This initiates a background process to copy the artifact
-    from MinIO to BU Globus for long-term preservation.
+    This queues a background process to copy the artifact
+    from MinIO to BU Globus for long-term preservation and returns
+    immediately. Poll the storage-locations endpoint for completion.
 
     Args:
         artifact_id: Artifact identifier
+        background_tasks: FastAPI background task queue
 
     Returns:
         Replication status
     """
     try:
-        result = await factory.storage_location_service.replicate_to_archive(artifact_id)
-        return result
+        hot_location = await factory.storage_location_service.get_primary_location(
+            artifact_id, StorageType.HOT
+        )
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Replication failed: {str(e)}")
+        raise HTTPException(status_code=404, detail=f"Artifact not found: {str(e)}")
+
+    if not hot_location:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No hot storage location found for artifact {artifact_id}",
+        )
+
+    background_tasks.add_task(
+        factory.storage_location_service.replicate_to_archive, artifact_id
+    )
+    return {"artifact_id": artifact_id, "status": "replication_queued"}
 
 
 @router.post("/artifacts/{artifact_id}/validate-fixity")
@@ -94,7 +159,7 @@ async def validate_fixity(artifact_id: str):
 
 
 @router.get("/artifacts/{artifact_id}/fixity")
-async def get_fixity_info(artifact_id: str):
+async def get_fixity_info(artifact_id: str, factory: Factory = Depends(get_app_factory)):
     """
     Get fixity information (checksums) for an artifact.
 
@@ -105,7 +170,7 @@ async def get_fixity_info(artifact_id: str):
         Fixity information including checksums and calculation timestamps
     """
     try:
-        artifact = await factory.db.get_artifact(artifact_id)
+        artifact = await factory.db.get_artifact(artifact_id, projection={"fixity": 1})
         if not artifact:
             raise HTTPException(status_code=404, detail="Artifact not found")
 
@@ -115,7 +180,7 @@ async def get_fixity_info(artifact_id: str):
                 status_code=404, detail="No fixity information available"
             )
 
-        return {"artifact_id": artifact_id, "fixity": fixity}
+        return DocumentResponse({"artifact_id": artifact_id, "fixity": fixity})
     except HTTPException:
         raise
     except Exception as e:
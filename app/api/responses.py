@@ -0,0 +1,39 @@
+"""
+JSON responses for raw MongoDB documents.
+"""
+
+from typing import Any
+import orjson
+from fastapi.responses import ORJSONResponse
+
+# Mongo returns naive datetimes that are UTC; mark them as such and format
+# every datetime with a trailing Z
+DOCUMENT_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+def dumps_document(document: Any) -> bytes:
+    """
+    Serialize a MongoDB document (or part of one) to JSON bytes.
+
+    Datetimes are formatted by orjson; any remaining BSON types (e.g. a
+    nested ObjectId) fall back to str.
+
+    Args:
+        document: Document to serialize
+
+    Returns:
+        JSON-encoded bytes
+    """
+    return orjson.dumps(document, default=str, option=DOCUMENT_ORJSON_OPTIONS)
+
+
+class DocumentResponse(ORJSONResponse):
+    """
+    Response for returning raw MongoDB documents directly.
+
+    Returning it from a route skips FastAPI's jsonable_encoder pass, so
+    datetimes are formatted by orjson instead of Python isoformat calls.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps_document(content)
@@ -1,6 +1,6 @@
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from functools import lru_cache
+from functools import cache, cached_property
 from typing import Literal
 
 
@@ -54,6 +54,21 @@ class StorageSettings(BaseSettings):
         default=True,
         description="Use HTTPS for connections",
     )
+    part_size_mb: int = Field(
+        default=32,
+        ge=5,
+        description="Multipart upload part size in MiB (S3 minimum is 5)",
+    )
+    upload_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Number of multipart upload parts sent in parallel",
+    )
+    max_connections: int = Field(
+        default=32,
+        ge=1,
+        description="Maximum pooled HTTP connections to storage (covers concurrent uploads x upload_concurrency)",
+    )
 
 
 class GlobusSettings(BaseSettings):
@@ -105,10 +120,15 @@ class CORSSettings(BaseSettings):
         default=["*"],
         description="Allowed HTTP headers",
     )
+    max_age: int = Field(
+        default=86400,
+        ge=0,
+        description="Seconds browsers may cache preflight responses (browsers clamp this, e.g. Chrome to 7200)",
+    )
 
-    @property
+    @cached_property
     def origins_list(self) -> list[str]:
-        """Convert comma-separated origins to list"""
+        """Convert comma-separated origins to list (computed once per instance)"""
         return [origin.strip() for origin in self.allowed_origins.split(",") if origin.strip()]
 
 
@@ -193,10 +213,13 @@ class Settings(BaseSettings):
     )
 
 
-@lru_cache
+@cache
 def get_settings() -> Settings:
     """
     Get cached application settings.
     Settings are loaded from environment variables with proper prefixes.
+
+    Always use this instead of instantiating Settings() directly: every
+    Settings() call re-scans the environment for each nested section.
     """
     return Settings()
@@ -1,15 +1,23 @@
-from functools import lru_cache
+from __future__ import annotations
+
+from functools import cache, cached_property
+from typing import TYPE_CHECKING
+from fastapi import Request
 from app.config.settings import get_settings, Settings
-from app.services.db import Database
-from app.services.object_storage import ObjectStorage
-from app.services.fixity_service import FixityService
-from app.services.storage_location_service import StorageLocationService
-from app.services.preservation_event_service import PreservationEventService
-from app.services.ingestion_service import IngestionService
-from app.services.globus_service import GlobusService
-from app.services.collection_service import CollectionService
 import logging
 
+# Service modules (and the MinIO/Globus SDKs behind them) are imported
+# inside the properties below so unused service trees are never loaded
+if TYPE_CHECKING:
+    from app.services.db import Database
+    from app.services.object_storage import ObjectStorage
+    from app.services.fixity_service import FixityService
+    from app.services.storage_location_service import StorageLocationService
+    from app.services.preservation_event_service import PreservationEventService
+    from app.services.ingestion_service import IngestionService
+    from app.services.globus_service import GlobusService
+    from app.services.collection_service import CollectionService
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,61 +30,138 @@ class Factory:
     def __init__(self):
         self.settings: Settings = get_settings()
 
-        # Core database service
-        self.db = Database(
+    # Services are built on first access so requests that only touch a
+    # subset don't pay for every client and SDK at startup
+
+    @cached_property
+    def db(self) -> Database:
+        """Core database service"""
+        from app.services.db import Database
+
+        return Database(
             uri=self.settings.database.uri,
             db_name=self.settings.database.name,
+            max_pool_size=self.settings.database.max_pool_size,
+            min_pool_size=self.settings.database.min_pool_size,
         )
 
-        # Storage service (MinIO/S3)
-        self.storage = ObjectStorage(
+    @cached_property
+    def storage(self) -> ObjectStorage:
+        """Storage service (MinIO/S3)"""
+        from app.services.object_storage import ObjectStorage
+
+        return ObjectStorage(
             endpoint=self.settings.storage.endpoint,
             access_key=self.settings.storage.access_key,
             secret_key=self.settings.storage.secret_key,
             bucket=self.settings.storage.bucket,
             region=self.settings.storage.region,
             secure=self.settings.storage.secure,
+            max_connections=self.settings.storage.max_connections,
         )
 
-        # Preservation services
-        self.fixity_service = FixityService()
-        self.storage_location_service = StorageLocationService(self.db)
-        self.preservation_event_service = PreservationEventService(self.db)
+    # Preservation services
+
+    @cached_property
+    def fixity_service(self) -> FixityService:
+        from app.services.fixity_service import FixityService
+
+        return FixityService()
+
+    @cached_property
+    def storage_location_service(self) -> StorageLocationService:
+        from app.services.storage_location_service import StorageLocationService
+
+        return StorageLocationService(self.db)
+
+    @cached_property
+    def preservation_event_service(self) -> PreservationEventService:
+        from app.services.preservation_event_service import PreservationEventService
+
+        return PreservationEventService(self.db)
+
+    @cached_property
+    def ingestion_service(self) -> IngestionService:
+        """Ingestion orchestrator"""
+        from app.services.ingestion_service import IngestionService
 
-        # Ingestion orchestrator
-        self.ingestion_service = IngestionService(
+        return IngestionService(
             db=self.db,
             storage=self.storage,
             settings=self.settings,
         )
 
-        # Globus and Collection services (conditional on GLOBUS_ENABLED)
-        if self.settings.globus.enabled:
-            try:
-                self.globus_service = GlobusService(self.settings)
-                self.collection_service = CollectionService(
-                    db=self.db,
-                    globus=self.globus_service,
-                    settings=self.settings,
-                )
-                logger.info("Globus and Collection services initialized successfully")
-            except Exception as e:
-                logger.warning(f"Failed to initialize Globus services: {e}")
-                self.globus_service = None
-                self.collection_service = None
-        else:
+    # Globus and Collection services (conditional on GLOBUS_ENABLED)
+
+    @cached_property
+    def globus_service(self) -> GlobusService | None:
+        globus = self.settings.globus
+        if not globus.enabled:
             logger.info("Globus services disabled (GLOBUS_ENABLED=false)")
-            self.globus_service = None
-            self.collection_service = None
+            return None
+
+        # Check configuration before touching the SDK so an incomplete
+        # setup degrades immediately instead of after a token request
+        missing = [
+            name
+            for name in ("client_id", "client_secret", "endpoint_id", "base_path")
+            if not getattr(globus, name)
+        ]
+        if missing:
+            logger.warning(
+                f"Globus services unavailable, missing settings: {', '.join(missing)}"
+            )
+            return None
+
+        try:
+            from app.services.globus_service import GlobusService
+
+            globus_service = GlobusService(self.settings)
+            logger.info("Globus service initialized successfully")
+            return globus_service
+        except Exception as e:
+            logger.warning(f"Failed to initialize Globus services: {e}")
+            return None
+
+    @cached_property
+    def collection_service(self) -> CollectionService | None:
+        if self.globus_service is None:
+            return None
+
+        from app.services.collection_service import CollectionService
 
+        try:
+            collection_service = CollectionService(
+                db=self.db,
+                globus=self.globus_service,
+                settings=self.settings,
+            )
+            logger.info("Collection service initialized successfully")
+            return collection_service
+        except Exception as e:
+            logger.warning(f"Failed to initialize Collection service: {e}")
+            return None
 
-@lru_cache
+    async def close(self) -> None:
+        """Close clients that were actually created."""
+        if "db" in self.__dict__:
+            await self.db.close()
+
+
+@cache
 def get_factory():
     """Singleton factory for the application."""
     return Factory()
 
 
-# Create the singleton factory instance
-factory = get_factory()
+async def get_app_factory(request: Request) -> Factory:
+    """
+    Route dependency returning the factory built by the app lifespan.
+
+    Being async, it runs on the event loop instead of being dispatched to
+    the thread pool on every request as a sync dependency would be.
+    """
+    return request.app.state.factory
+
 
-__all__ = ["factory", "get_factory", "get_settings"]
+__all__ = ["Factory", "get_app_factory", "get_factory", "get_settings"]
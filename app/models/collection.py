@@ -2,9 +2,10 @@
 Collection models for Globus archival storage.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from datetime import datetime
 from enum import Enum
+from app.models.metadata import utcnow
 
 
 class CollectionStatus(str, Enum):
@@ -43,10 +44,11 @@ class Collection(BaseModel):
     collection_checksum_sha256: str | None = None
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
     uploaded_at: datetime | None = None
     verified_at: datetime | None = None
     sealed_at: datetime | None = None
+    updated_at: datetime | None = None
 
     # Metadata
     description: str | None = None
@@ -54,6 +56,11 @@ class Collection(BaseModel):
     creator: str | None = None
 
 
+# Shared validator for collection list pages, built once at import so a
+# page of documents is validated in one pydantic-core call
+COLLECTION_LIST_ADAPTER = TypeAdapter(list[Collection])
+
+
 class CollectionDraftRequest(BaseModel):
     """Request to create a collection draft"""
     title: str = Field(min_length=1, max_length=200)
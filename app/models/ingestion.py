@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
 from app.models.metadata import (
+    utcnow,
     ContentInfo,
     ProductionInfo,
     Licensing,
@@ -76,7 +77,7 @@ class IngestionResponse(BaseModel):
         description="Human-readable status message",
     )
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="Timestamp of ingestion",
     )
     storage_path: str | None = Field(
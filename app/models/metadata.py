@@ -1,10 +1,21 @@
-from pydantic import BaseModel, Field, ConfigDict
-from datetime import datetime
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
+from datetime import datetime, timezone
+from functools import partial
 from enum import Enum
 
+# Timezone-aware UTC "now", shared by model defaults and services
+utcnow = partial(datetime.now, timezone.utc)
 
-class Base(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+class FrozenBase(BaseModel):
+    """
+    Base for immutable value objects (checksums, locations, events and the
+    nested artifact metadata parts). Sequence fields are tuples so the
+    empty default is shared. Unknown keys are still ignored so documents
+    written by older versions keep loading.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
 
 # ============================================
@@ -37,17 +48,17 @@ class FixityAlgorithm(str, Enum):
     SHA512 = "sha512"
 
 
-class FixityInfo(BaseModel):
+class FixityInfo(FrozenBase):
     """Fixity information for integrity verification"""
 
     checksum_md5: str = Field(description="MD5 checksum of the file")
     checksum_sha256: str = Field(description="SHA-256 checksum of the file")
-    algorithm: list[FixityAlgorithm] = Field(
-        default=[FixityAlgorithm.MD5, FixityAlgorithm.SHA256],
+    algorithm: tuple[FixityAlgorithm, ...] = Field(
+        default=(FixityAlgorithm.MD5, FixityAlgorithm.SHA256),
         description="Algorithms used for checksum calculation",
     )
     calculated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="Timestamp when checksums were calculated",
     )
     verified_at: datetime | None = Field(
@@ -56,7 +67,7 @@ class FixityInfo(BaseModel):
     )
 
 
-class StorageLocation(BaseModel):
+class StorageLocation(FrozenBase):
     """Storage location information for an artifact"""
 
     storage_type: StorageType = Field(description="Type of storage (hot/archive)")
@@ -69,7 +80,7 @@ class StorageLocation(BaseModel):
     checksum_md5: str = Field(description="MD5 checksum at this location")
     checksum_sha256: str = Field(description="SHA-256 checksum at this location")
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="Timestamp when file was stored at this location",
     )
     verified_at: datetime | None = Field(
@@ -100,12 +111,12 @@ class PreservationEventOutcome(str, Enum):
     WARNING = "warning"
 
 
-class PreservationEvent(BaseModel):
+class PreservationEvent(FrozenBase):
     """PREMIS preservation event for audit trail"""
 
     event_type: PreservationEventType = Field(description="Type of preservation event")
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="When the event occurred",
     )
     agent: str = Field(
@@ -124,19 +135,24 @@ class PreservationEvent(BaseModel):
     )
 
 
+# Shared validator for an artifact's event list, built once at import so
+# stored events are validated in one pydantic-core call
+PRESERVATION_EVENT_LIST_ADAPTER = TypeAdapter(list[PreservationEvent])
+
+
 # ============================================
 # Content & Descriptive Metadata Models
 # ============================================
 
 
-class ContentInfo(BaseModel):
+class ContentInfo(FrozenBase):
     genre: str | None = None
     language: str | None = None
-    themes: list[str] = Field(default_factory=list)
-    keywords: list[str] = Field(default_factory=list)
+    themes: tuple[str, ...] = ()
+    keywords: tuple[str, ...] = ()
 
 
-class ProductionInfo(BaseModel):
+class ProductionInfo(FrozenBase):
     director: str | None = None
     producer: str | None = None
     editor: str | None = None
@@ -144,13 +160,13 @@ class ProductionInfo(BaseModel):
     cinematographer: str | None = None
 
 
-class Duration(BaseModel):
+class Duration(FrozenBase):
     minutes: int | None = None
     seconds: int | None = None
     hours: int | None = None
 
 
-class TypeMetadata(BaseModel):
+class TypeMetadata(FrozenBase):
     duration: Duration | None = None
     file_size_mb: float | None = None
 
@@ -171,26 +187,26 @@ class VideoMetadata(TypeMetadata):
     codec: str | None = None
 
 
-class Licensing(BaseModel):
+class Licensing(FrozenBase):
     license_type: str | None = None
     license_url: str | None = None
     rights_holder: str | None = None
     expiration_date: str | None = None
 
 
-class AIContribution(BaseModel):
+class AIContribution(FrozenBase):
     type: str | None = None
     ai_tool: str | None = None
     original_content_percentage: float | None = None
     ai_generated_percentage: float | None = None
 
 
-class AISpecificMetadata(BaseModel):
-    contributions: list[AIContribution] = Field(default_factory=list)
-    ethical_considerations: list[str] = Field(default_factory=list)
+class AISpecificMetadata(FrozenBase):
+    contributions: tuple[AIContribution, ...] = ()
+    ethical_considerations: tuple[str, ...] = ()
 
 
-class ArchivalInfo(BaseModel):
+class ArchivalInfo(FrozenBase):
     creation_date: str = Field(description="An exact date or estimate")
     checksum: str | None = None
     storage_location: str | None = None
@@ -225,6 +241,11 @@ class ArtifactCreate(ArtifactBase):
     ...
 
 
+# Shared validator for bulk artifact payloads, built once at import so
+# raw JSON bodies can be validated directly by pydantic-core
+ARTIFACT_CREATE_LIST_ADAPTER = TypeAdapter(list[ArtifactCreate])
+
+
 class Artifact(ArtifactBase):
     version: int = 0
     status: ArtifactStatus = Field(
@@ -248,29 +269,31 @@ class Artifact(ArtifactBase):
         description="Internal metadata for tracking processing pipeline state",
     )
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="Timestamp when artifact was created",
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="Timestamp when artifact was last updated",
     )
 
+    # Both constructors reuse the already-validated field values of their
+    # inputs instead of dumping and re-validating every nested model
+
     @classmethod
     def create(cls, artifact: ArtifactCreate):
-        return cls(**{**artifact.model_dump(), "version": 1})
+        return cls.model_construct(**dict(artifact), version=1)
 
     @classmethod
-    def update(cls, artifact: ArtifactBase, update: ArtifactCreate):
-        return cls(
-            **{
-                **artifact.model_dump(),
-                **update.model_dump(),
+    def update(cls, artifact: "Artifact", update: ArtifactCreate):
+        return artifact.model_copy(
+            update={
+                **dict(update),
                 "version": artifact.version + 1,
-                "updated_at": datetime.utcnow(),
+                "updated_at": utcnow(),
             }
         )
 
 
 class ArtifactGroup(BaseModel):
-    ids: list[str] = Field(description="The unique identifiers for the artifact.")
+    ids: frozenset[str] = Field(description="The unique identifiers for the artifact.")
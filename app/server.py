@@ -1,11 +1,51 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+import asyncio
+import logging
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from .api import artifacts_router
 from .api.preservation import router as preservation_router
 from .api.collections import router as collections_router
-from .factory import get_settings
+from .factory import get_factory, get_settings
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Delay between attempts to create indexes while MongoDB is unreachable
+INDEX_RETRY_SECONDS = 30
+
+
+async def _ensure_indexes(db) -> None:
+    """
+    Create database indexes, retrying in the background until MongoDB answers.
+
+    Startup does not wait on this, so the app (and /health) still comes up
+    when MongoDB is briefly unreachable; requests report database errors
+    as they did before indexes were created at startup.
+    """
+    while True:
+        try:
+            await db.ensure_indexes()
+            return
+        except Exception as e:
+            logger.warning(
+                f"Failed to create database indexes, retrying in "
+                f"{INDEX_RETRY_SECONDS}s: {e}"
+            )
+            await asyncio.sleep(INDEX_RETRY_SECONDS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the shared service clients once and close them on shutdown."""
+    app.state.factory = get_factory()
+    index_task = asyncio.create_task(_ensure_indexes(app.state.factory.db))
+    yield
+    index_task.cancel()
+    await app.state.factory.close()
+
 
 app = FastAPI(
     title=settings.app_name,
@@ -13,6 +53,8 @@ app = FastAPI(
     version=settings.app_version,
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Configure CORS using settings
@@ -22,6 +64,7 @@ app.add_middleware(
     allow_credentials=settings.cors.allow_credentials,
     allow_methods=settings.cors.allow_methods,
     allow_headers=settings.cors.allow_headers,
+    max_age=settings.cors.max_age,
 )
 
 # Include API routers
@@ -30,29 +73,36 @@ app.include_router(preservation_router)
 app.include_router(collections_router)
 
 
+# Both bodies depend only on settings, which are fixed for the life of the
+# process, so they are encoded once here
+_ROOT_BODY = orjson.dumps({
+    "message": "Griot and Grits Digital Preservation API",
+    "version": settings.app_version,
+    "environment": settings.environment,
+    "endpoints": {
+        "artifacts": "/artifacts",
+        "preservation": "/preservation",
+        "collections": "/collections" if settings.globus.enabled else None,
+        "docs": "/docs",
+    },
+})
+
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "environment": settings.environment,
+    "storage": {
+        "hot": settings.storage.endpoint,
+        "archive_enabled": settings.globus.enabled,
+    },
+})
+
+
 @app.get("/")
-def read_root():
-    return {
-        "message": "Griot and Grits Digital Preservation API",
-        "version": settings.app_version,
-        "environment": settings.environment,
-        "endpoints": {
-            "artifacts": "/artifacts",
-            "preservation": "/preservation",
-            "collections": "/collections" if settings.globus.enabled else None,
-            "docs": "/docs",
-        },
-    }
+async def read_root():
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint for monitoring"""
-    return {
-        "status": "healthy",
-        "environment": settings.environment,
-        "storage": {
-            "hot": settings.storage.endpoint,
-            "archive_enabled": settings.globus.enabled,
-        },
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
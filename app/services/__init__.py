@@ -1,13 +1,20 @@
-from .object_storage import ObjectStorage
-from .metadata_service import MetadataService
-from .transcription import Transcription
-from .db import Database
-from .fixity_service import FixityService
-from .storage_location_service import StorageLocationService
-from .preservation_event_service import PreservationEventService
-from .ingestion_service import IngestionService
-from .globus_service import GlobusService
-from .collection_service import CollectionService
+import importlib
+
+# Importing any submodule (e.g. app.services.db) runs this package first,
+# so services are resolved on attribute access (PEP 562) instead of
+# eagerly loading every service and its SDK
+_LAZY = {
+    "ObjectStorage": ".object_storage",
+    "MetadataService": ".metadata_service",
+    "Transcription": ".transcription",
+    "Database": ".db",
+    "FixityService": ".fixity_service",
+    "StorageLocationService": ".storage_location_service",
+    "PreservationEventService": ".preservation_event_service",
+    "IngestionService": ".ingestion_service",
+    "GlobusService": ".globus_service",
+    "CollectionService": ".collection_service",
+}
 
 __all__ = [
     "ObjectStorage",
@@ -21,3 +28,17 @@ __all__ = [
     "GlobusService",
     "CollectionService",
 ]
+
+
+def __getattr__(name: str):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
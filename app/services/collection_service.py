@@ -2,14 +2,17 @@
 Service for managing preservation collections.
 """
 
-from datetime import datetime
+import asyncio
 import re
 import uuid
+from pymongo.errors import DuplicateKeyError
 from app.models.collection import (
+    COLLECTION_LIST_ADAPTER,
     Collection,
     CollectionDraftRequest,
     CollectionStatus,
 )
+from app.models.metadata import utcnow
 from app.services.globus_service import GlobusService, GlobusServiceError
 from app.services.db import Database
 from app.config.settings import Settings
@@ -17,6 +20,10 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+_SLUG_INSERT_ATTEMPTS = 3
+
 
 class CollectionService:
     """Service for preservation collection lifecycle"""
@@ -42,32 +49,41 @@ class CollectionService:
             Collection with DRAFT status
         """
         # Generate or validate slug
-        slug = request.slug or self._generate_slug(request.title)
-
-        # Ensure slug is unique
-        existing = await self.db.get_collection_by_slug(slug)
-        if existing:
-            # Append random suffix to make unique
-            slug = f"{slug}-{uuid.uuid4().hex[:6]}"
-
-        # Build path: /archive/2025-01/{slug}/
-        globus_path = self._build_archive_path(slug)
-
-        # Create collection
-        collection = Collection(
-            collection_id=self._generate_collection_id(),
-            title=request.title,
-            slug=slug,
-            globus_path=globus_path,
-            globus_endpoint_id=self.settings.globus.endpoint_id,
-            description=request.description,
-            expected_artifact_count=request.expected_artifact_count,
-            tags=request.tags or [],
-            creator=request.creator,
-        )
+        base_slug = request.slug or self._generate_slug(request.title)
+        slug = base_slug
+
+        # The unique slug index enforces uniqueness; on the rare collision,
+        # retry with a random suffix instead of pre-checking every insert
+        for attempt in range(_SLUG_INSERT_ATTEMPTS):
+            # Build path: /archive/2025-01/{slug}/
+            globus_path = self._build_archive_path(slug)
+
+            # Create collection
+            collection = Collection(
+                collection_id=self._generate_collection_id(),
+                title=request.title,
+                slug=slug,
+                globus_path=globus_path,
+                globus_endpoint_id=self.settings.globus.endpoint_id,
+                description=request.description,
+                expected_artifact_count=request.expected_artifact_count,
+                tags=request.tags or [],
+                creator=request.creator,
+            )
 
-        # Save to database
-        await self.db.insert_collection(collection)
+            # Save to database
+            try:
+                await self.db.insert_collection(collection)
+                break
+            except DuplicateKeyError as e:
+                if "slug" not in (e.details or {}).get("keyPattern", {}):
+                    raise
+                if attempt == _SLUG_INSERT_ATTEMPTS - 1:
+                    raise CollectionServiceError(
+                        f"Could not allocate a unique slug for '{base_slug}'"
+                    )
+                # Append random suffix to make unique
+                slug = f"{base_slug}-{uuid.uuid4().hex[:6]}"
 
         # Create directory structure in Globus
         # /archive/2025-01/{slug}/
@@ -75,8 +91,11 @@ class CollectionService:
         # └── processed/ (created by jobs)
         try:
             await self.globus.create_directory(globus_path)
-            await self.globus.create_directory(f"{globus_path}raw/")
-            await self.globus.create_directory(f"{globus_path}processed/")
+            # Subdirectories only depend on the parent; create them together
+            await asyncio.gather(
+                self.globus.create_directory(f"{globus_path}raw/"),
+                self.globus.create_directory(f"{globus_path}processed/"),
+            )
             logger.info(f"Created Globus directory structure: {globus_path}{{raw/,processed/}}")
         except GlobusServiceError as e:
             logger.warning(f"Failed to create Globus directory structure (non-fatal): {e}")
@@ -117,17 +136,14 @@ class CollectionService:
             raw_path = f"{collection.globus_path}raw/"
             logger.info(f"Verifying collection {collection_id} at {raw_path}")
 
-            raw_files = await self.globus.list_directory(raw_path)
-
-            # Check for files at root level (optional manifest.json)
-            root_files = await self.globus.list_directory(collection.globus_path)
-            root_file_names = {f["name"] for f in root_files if f["type"] == "file"}
-            has_manifest = "manifest.json" in root_file_names
+            # Summarize raw/ and stat the optional root manifest.json concurrently
+            raw_stats, has_manifest = await asyncio.gather(
+                self.globus.stat_directory(raw_path),
+                self.globus.file_exists(f"{collection.globus_path}manifest.json"),
+            )
 
-            # Count files in raw/
-            raw_file_list = [f for f in raw_files if f["type"] == "file"]
-            raw_file_count = len(raw_file_list)
-            total_size = sum(f.get("size", 0) for f in raw_file_list)
+            raw_file_count = raw_stats["count"]
+            total_size = raw_stats["total_size"]
 
             # Determine status and errors
             verification_errors = []
@@ -148,7 +164,7 @@ class CollectionService:
             all_messages = verification_errors + warnings
 
             # Update collection
-            now = datetime.utcnow()
+            now = utcnow()
             updates = {
                 "status": status.value,
                 "has_manifest": has_manifest,
@@ -226,21 +242,21 @@ class CollectionService:
         Returns:
             Tuple of (packages list, total count)
         """
-        collections_dicts = await self.db.list_collections(status, limit, skip)
-        collections = [Collection(**p) for p in collections_dicts]
-        total = await self.db.count_collections(status)
+        # Page and count are independent queries; overlap their round trips
+        collections_dicts, total = await asyncio.gather(
+            self.db.list_collections(status, limit, skip),
+            self.db.count_collections(status),
+        )
+        collections = COLLECTION_LIST_ADAPTER.validate_python(collections_dicts)
         return collections, total
 
     def _generate_slug(self, title: str) -> str:
         """Generate URL-safe slug from title"""
-        slug = title.lower()
-        slug = re.sub(r'[^a-z0-9]+', '-', slug)
-        slug = slug.strip('-')
-        return slug[:50]
+        return _SLUG_RE.sub('-', title.lower()).strip('-')[:50]
 
     def _build_archive_path(self, slug: str) -> str:
         """Build archive path: /archive/2025-01/{slug}/"""
-        month = datetime.utcnow().strftime("%Y-%m")
+        month = utcnow().strftime("%Y-%m")
         base = self.settings.globus.base_path.rstrip('/')
         return f"{base}/{month}/{slug}/"
 
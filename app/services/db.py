@@ -1,38 +1,145 @@
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from motor.motor_asyncio import (
+    AsyncIOMotorClient,
+    AsyncIOMotorCollection,
+    AsyncIOMotorCommandCursor,
+)
 from datetime import datetime
+from typing import Iterable
 from bson import ObjectId
+from pymongo.errors import BulkWriteError
+import time
 from app.models.metadata import (
+    utcnow,
     Artifact,
     ArtifactStatus,
     StorageLocation,
     PreservationEvent,
+    PreservationEventType,
     StorageType,
 )
 from app.models.collection import Collection, CollectionStatus
 
 
+# Pipeline stages returning artifacts in API shape: _id exposed as a
+# string artifact_id, converted server-side
+_ARTIFACT_ID_STAGES = [
+    {"$addFields": {"artifact_id": {"$toString": "$_id"}}},
+    {"$project": {"_id": 0}},
+]
+
+# Polled single-document reads are cached briefly. The cache is per worker
+# process, so a write made through another worker can be served stale for
+# up to the TTL; keep it no longer than the Cache-Control max-age
+_READ_CACHE_TTL = 5.0
+_READ_CACHE_MAXSIZE = 10_000
+
+
+class _ReadCache:
+    """
+    Small in-process TTL cache for single-document reads.
+
+    Entries are grouped by document id so every cached variant of a
+    document (full, projected, API-shaped) is dropped on write. Writes
+    from other processes are only picked up once the TTL expires. Misses
+    (document not found) are never cached, so a document created by
+    another process is visible on the next read.
+
+    A read takes a generation token before querying and passes it to set;
+    if the document was invalidated in between, the (possibly stale)
+    result is not cached. Cached documents are shared between callers and
+    must not be mutated.
+    """
+
+    def __init__(self, maxsize: int = _READ_CACHE_MAXSIZE):
+        self.maxsize = maxsize
+        self._entries: dict[tuple, tuple[float, dict]] = {}
+        self._keys_by_id: dict[tuple, set[tuple]] = {}
+        # Generation of each recently invalidated id, drawn from one
+        # increasing clock; ids without one report _floor, the clock value
+        # when the table was last cleared
+        self._clock = 0
+        self._floor = 0
+        self._generations: dict[tuple, int] = {}
+
+    def get(self, key: tuple) -> tuple[bool, dict | None]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, doc = entry
+        if expires_at < time.monotonic():
+            self._discard(key)
+            return False, None
+        return True, doc
+
+    def generation(self, key: tuple) -> int:
+        """Token to pass to set, taken before reading from the database."""
+        return self._generations.get(key[:2], self._floor)
+
+    def set(self, key: tuple, doc: dict | None, generation: int) -> None:
+        if doc is None or self.generation(key) != generation:
+            # Not found, or invalidated while the read was in flight
+            return
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            # Evict the oldest entry (dicts keep insertion order)
+            self._discard(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + _READ_CACHE_TTL, doc)
+        self._keys_by_id.setdefault(key[:2], set()).add(key)
+
+    def invalidate(self, kind: str, doc_id: str) -> None:
+        for key in self._keys_by_id.pop((kind, doc_id), ()):
+            self._entries.pop(key, None)
+
+        self._clock += 1
+        if len(self._generations) >= self.maxsize:
+            # Every token taken so far is below the new floor, so in-flight
+            # reads are refused rather than risking a stale set
+            self._generations.clear()
+            self._floor = self._clock
+        self._generations[(kind, doc_id)] = self._clock
+
+    def _discard(self, key: tuple) -> None:
+        self._entries.pop(key, None)
+        keys = self._keys_by_id.get(key[:2])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_id[key[:2]]
+
+
 class Database:
     """
     Database service for the application.
     Enhanced with preservation metadata support.
     """
 
-    def __init__(self, uri: str, db_name: str):
+    def __init__(
+        self,
+        uri: str,
+        db_name: str,
+        max_pool_size: int = 10,
+        min_pool_size: int = 1,
+    ):
         self.client = AsyncIOMotorClient(
             uri,
             tls=True,
-            tlsAllowInvalidCertificates=False
+            tlsAllowInvalidCertificates=False,
+            maxPoolSize=max_pool_size,
+            minPoolSize=min_pool_size,
         )
         self.db = self.client[db_name]
-        self._indexes_created = False
+        self._read_cache = _ReadCache()
 
-    async def _ensure_indexes(self):
-        """Create database indexes for optimized queries"""
-        if self._indexes_created:
-            return
+    async def ensure_indexes(self):
+        """
+        Create database indexes for optimized queries.
+
+        Called once at application startup; create_index is idempotent, so
+        repeated calls (e.g. from several workers) are harmless.
+        """
 
         # Indexes for artifact queries
         await self.db.artifacts.create_index("status")
+        await self.db.artifacts.create_index([("status", 1), ("_id", 1)])
         await self.db.artifacts.create_index("created_at")
         await self.db.artifacts.create_index([("title", "text"), ("description", "text")])
         await self.db.artifacts.create_index("storage_locations.checksum_sha256")
@@ -43,8 +150,6 @@ class Database:
         await self.db.collections.create_index("slug", unique=True)
         await self.db.collections.create_index("created_at")
 
-        self._indexes_created = True
-
     async def get_collection(self, collection_name: str) -> AsyncIOMotorCollection:
         return self.db[collection_name]
 
@@ -59,40 +164,198 @@ class Database:
         Returns:
             List of artifact documents
         """
-        await self._ensure_indexes()
         query = self.db.artifacts.find().skip(skip)
         if limit:
-            query = query.limit(limit)
-        return await query.to_list(length=None)
+            query = query.limit(limit).batch_size(limit)
+        return await query.to_list(length=limit)
+
+    async def find_artifacts_paged(
+        self,
+        limit: int,
+        after: str | None = None,
+        status: ArtifactStatus | None = None,
+        skip: int = 0,
+        search: str | None = None,
+    ) -> AsyncIOMotorCommandCursor:
+        """
+        Build a cursor over a page of artifacts using range-based (cursor) pagination.
 
-    async def get_artifact(self, artifact_id: str):
+        Artifacts are ordered by _id, and the next page starts strictly after
+        the last _id of the previous one, so deep pages stay index-bound
+        instead of walking every skipped document.
+
+        Args:
+            limit: Maximum number of artifacts in the page
+            after: Cursor (_id of the last artifact from the previous page)
+            status: Optional status filter
+            skip: Number of artifacts to skip (deprecated, prefer after)
+            search: Optional full-text search over title and description,
+                served by the text index
+
+        Returns:
+            Cursor yielding up to limit + 1 artifact documents in API shape
+            (artifact_id instead of _id); the extra document only signals
+            that another page exists
+        """
+        query = {}
+        if search:
+            query["$text"] = {"$search": search}
+        if status:
+            query["status"] = status.value
+        if after:
+            query["_id"] = {"$gt": ObjectId(after)}
+
+        # $match and $sort lead the pipeline so the (status, _id) index is used
+        pipeline = [{"$match": query}, {"$sort": {"_id": 1}}]
+        if skip:
+            pipeline.append({"$skip": skip})
+        # Fetch one extra document to learn whether another page exists
+        # without a separate count query; one batch holds the whole page
+        pipeline.append({"$limit": limit + 1})
+        pipeline.extend(_ARTIFACT_ID_STAGES)
+        return self.db.artifacts.aggregate(pipeline, batchSize=limit + 1)
+
+    async def get_artifact(self, artifact_id: str, projection: dict | None = None):
         """
         Get an artifact from the database by ID.
 
         Args:
             artifact_id: Artifact identifier
+            projection: Optional fields to return (e.g. {"fixity": 1});
+                returns the full document when omitted
 
         Returns:
             Artifact document or None if not found
         """
+        key = ("artifact", artifact_id, tuple(sorted((projection or {}).items())))
+        hit, artifact = self._read_cache.get(key)
+        if hit:
+            return artifact
+        generation = self._read_cache.generation(key)
+
         try:
-            return await self.db.artifacts.find_one({"_id": ObjectId(artifact_id)})
+            artifact = await self.db.artifacts.find_one(
+                {"_id": ObjectId(artifact_id)}, projection
+            )
         except Exception:
             # If ID is not a valid ObjectId, try as string
-            return await self.db.artifacts.find_one({"_id": artifact_id})
+            artifact = await self.db.artifacts.find_one({"_id": artifact_id}, projection)
+
+        self._read_cache.set(key, artifact, generation)
+        return artifact
+
+    async def get_preservation_events(
+        self,
+        artifact_id: str,
+        event_type: PreservationEventType | None = None,
+        limit: int | None = None,
+        newest_first: bool = False,
+        event_types: Iterable[PreservationEventType] | None = None,
+    ) -> list[dict] | None:
+        """
+        Get an artifact's preservation events, filtered and trimmed server-side.
+
+        Events are appended as they happen, so the array is already in
+        chronological order; the latest events are its tail.
+
+        Args:
+            artifact_id: Artifact identifier
+            event_type: Only return events of this type (optional)
+            limit: Only return the most recent N matching events (optional)
+            newest_first: Return events newest first instead of oldest first
+            event_types: Only return events of any of these types (optional,
+                combined with event_type)
+
+        Returns:
+            List of event documents, or None if the artifact was not found
+        """
+        values = None
+        if event_type is not None or event_types is not None:
+            values = frozenset(t.value for t in event_types or ())
+            if event_type is not None:
+                values |= {event_type.value}
+
+        key = ("artifact", artifact_id, ("events", values, limit, newest_first))
+        hit, doc = self._read_cache.get(key)
+        if hit:
+            return doc["events"] if doc else None
+        generation = self._read_cache.generation(key)
+
+        try:
+            oid = ObjectId(artifact_id)
+        except Exception:
+            oid = artifact_id
+
+        events = {"$ifNull": ["$preservation_events", []]}
+        if values is not None:
+            if len(values) == 1:
+                cond = {"$eq": ["$$event.event_type", next(iter(values))]}
+            else:
+                cond = {"$in": ["$$event.event_type", sorted(values)]}
+            events = {"$filter": {"input": events, "as": "event", "cond": cond}}
+        if limit is not None:
+            events = {"$slice": [events, -limit]}
+        if newest_first:
+            events = {"$reverseArray": events}
+
+        cursor = self.db.artifacts.aggregate(
+            [{"$match": {"_id": oid}}, {"$project": {"_id": 0, "events": events}}]
+        )
+        docs = await cursor.to_list(length=1)
+        doc = docs[0] if docs else None
+
+        self._read_cache.set(key, doc, generation)
+        return doc["events"] if doc else None
+
+    async def get_artifact_with_id(self, artifact_id: str) -> dict | None:
+        """
+        Get an artifact in API shape, with _id returned as a string artifact_id.
+
+        Args:
+            artifact_id: Artifact identifier
 
-    async def get_artifacts_by_status(self, status: ArtifactStatus):
+        Returns:
+            Artifact document or None if not found
         """
-        Get artifacts by processing status.
+        key = ("artifact", artifact_id, "api")
+        hit, artifact = self._read_cache.get(key)
+        if hit:
+            return artifact
+        generation = self._read_cache.generation(key)
+
+        try:
+            oid = ObjectId(artifact_id)
+        except Exception:
+            oid = artifact_id
+
+        cursor = self.db.artifacts.aggregate(
+            [{"$match": {"_id": oid}}, *_ARTIFACT_ID_STAGES]
+        )
+        artifacts = await cursor.to_list(length=1)
+        artifact = artifacts[0] if artifacts else None
+        self._read_cache.set(key, artifact, generation)
+        return artifact
+
+    async def get_artifacts_by_status(
+        self, status: ArtifactStatus, limit: int | None = None
+    ):
+        """
+        Get artifacts by processing status, in _id order.
+
+        Served entirely from the (status, _id) index; use
+        find_artifacts_paged to walk large result sets page by page.
 
         Args:
             status: Artifact status to filter by
+            limit: Maximum number of artifacts to return (None for all)
 
         Returns:
             List of artifact documents
         """
-        await self._ensure_indexes()
-        return await self.db.artifacts.find({"status": status.value}).to_list(length=None)
+        cursor = self.db.artifacts.find({"status": status.value}).sort("_id", 1)
+        if limit:
+            cursor = cursor.limit(limit).batch_size(limit)
+        return await cursor.to_list(length=limit)
 
     async def insert_artifact(self, collection: str, artifact: Artifact):
         """
@@ -105,11 +368,48 @@ class Database:
         Returns:
             Dictionary with inserted artifact ID
         """
-        await self._ensure_indexes()
-        artifact_dict = artifact.model_dump(mode="json")
+        artifact_dict = artifact.model_dump(mode="python")
         ior = await self.db.artifacts.insert_one(artifact_dict)
         return {"id": str(ior.inserted_id)}
 
+    async def insert_artifacts(self, artifacts: list[Artifact]) -> dict:
+        """
+        Insert many artifacts in a single round trip.
+
+        Uses an unordered insert so the server can apply the writes in
+        parallel and one failing document does not stop the rest.
+
+        Args:
+            artifacts: Artifact objects to insert
+
+        Returns:
+            Dictionary with the artifact IDs in input order (None where the
+            insert failed) and an error entry ({"index", "error"}) for each
+            failed document
+        """
+        # Call the core serializer directly; model_dump's Python-level
+        # argument handling adds up over a 1000-document batch
+        to_python = Artifact.__pydantic_serializer__.to_python
+        documents = [to_python(artifact, mode="python") for artifact in artifacts]
+
+        errors = []
+        try:
+            await self.db.artifacts.insert_many(documents, ordered=False)
+        except BulkWriteError as e:
+            errors = [
+                {"index": error["index"], "error": error.get("errmsg", "insert failed")}
+                for error in e.details.get("writeErrors", [])
+            ]
+
+        # insert_many assigns each document its _id before sending, so the
+        # ids of the documents that did go in are known even on failure
+        failed = {error["index"] for error in errors}
+        ids = [
+            None if index in failed else str(document["_id"])
+            for index, document in enumerate(documents)
+        ]
+        return {"ids": ids, "errors": errors}
+
     async def update_artifact_status(
         self, artifact_id: str, status: ArtifactStatus
     ) -> bool:
@@ -133,10 +433,11 @@ class Database:
             {
                 "$set": {
                     "status": status.value,
-                    "updated_at": datetime.utcnow(),
+                    "updated_at": utcnow(),
                 }
             },
         )
+        self._read_cache.invalidate("artifact", artifact_id)
         return result.modified_count > 0
 
     async def add_storage_location(
@@ -160,14 +461,15 @@ class Database:
         result = await self.db.artifacts.update_one(
             {"_id": oid},
             {
-                "$push": {"storage_locations": location.model_dump(mode="json")},
-                "$set": {"updated_at": datetime.utcnow()},
+                "$push": {"storage_locations": location.model_dump(mode="python")},
+                "$set": {"updated_at": utcnow()},
             },
         )
+        self._read_cache.invalidate("artifact", artifact_id)
         return result.modified_count > 0
 
     async def add_preservation_event(
-        self, artifact_id: str, event: PreservationEvent
+        self, artifact_id: str, event: PreservationEvent, updates: dict | None = None
     ) -> bool:
         """
         Add a preservation event to an artifact.
@@ -175,6 +477,8 @@ class Database:
         Args:
             artifact_id: Artifact identifier
             event: PreservationEvent object
+            updates: Optional dictionary of additional fields to set in the
+                same update
 
         Returns:
             True if added successfully
@@ -187,10 +491,49 @@ class Database:
         result = await self.db.artifacts.update_one(
             {"_id": oid},
             {
-                "$push": {"preservation_events": event.model_dump(mode="json")},
-                "$set": {"updated_at": datetime.utcnow()},
+                "$push": {"preservation_events": event.model_dump(mode="python")},
+                "$set": {**(updates or {}), "updated_at": utcnow()},
             },
         )
+        self._read_cache.invalidate("artifact", artifact_id)
+        return result.modified_count > 0
+
+    async def add_location_and_event(
+        self,
+        artifact_id: str,
+        location: StorageLocation,
+        event: PreservationEvent,
+        updates: dict | None = None,
+    ) -> bool:
+        """
+        Add a storage location and a preservation event, and optionally set
+        other fields, in a single update.
+
+        Args:
+            artifact_id: Artifact identifier
+            location: StorageLocation object
+            event: PreservationEvent object
+            updates: Optional dictionary of additional fields to set
+
+        Returns:
+            True if updated successfully
+        """
+        try:
+            oid = ObjectId(artifact_id)
+        except Exception:
+            oid = artifact_id
+
+        result = await self.db.artifacts.update_one(
+            {"_id": oid},
+            {
+                "$push": {
+                    "storage_locations": location.model_dump(mode="python"),
+                    "preservation_events": event.model_dump(mode="python"),
+                },
+                "$set": {**(updates or {}), "updated_at": utcnow()},
+            },
+        )
+        self._read_cache.invalidate("artifact", artifact_id)
         return result.modified_count > 0
 
     async def update_storage_location_verification(
@@ -220,10 +563,11 @@ class Database:
             {
                 "$set": {
                     "storage_locations.$.verified_at": verified_at,
-                    "updated_at": datetime.utcnow(),
+                    "updated_at": utcnow(),
                 }
             },
         )
+        self._read_cache.invalidate("artifact", artifact_id)
         return result.modified_count > 0
 
     async def update_artifact(self, artifact_id: str, updates: dict) -> bool:
@@ -242,11 +586,12 @@ class Database:
         except Exception:
             oid = artifact_id
 
-        updates["updated_at"] = datetime.utcnow()
+        updates["updated_at"] = utcnow()
         result = await self.db.artifacts.update_one(
             {"_id": oid},
             {"$set": updates},
         )
+        self._read_cache.invalidate("artifact", artifact_id)
         return result.modified_count > 0
 
     # ===== Collection Management Methods =====
@@ -261,9 +606,9 @@ class Database:
         Returns:
             Dictionary with inserted collection ID
         """
-        await self._ensure_indexes()
-        package_dict = package.model_dump(mode="json")
+        package_dict = package.model_dump(mode="python")
         result = await self.db.collections.insert_one(package_dict)
+        self._read_cache.invalidate("collection", package.collection_id)
         return {"id": str(result.inserted_id)}
 
     async def get_collection(self, collection_id: str) -> dict | None:
@@ -276,7 +621,15 @@ class Database:
         Returns:
             Collection document or None
         """
-        return await self.db.collections.find_one({"collection_id": collection_id})
+        key = ("collection", collection_id, None)
+        hit, collection = self._read_cache.get(key)
+        if hit:
+            return collection
+        generation = self._read_cache.generation(key)
+
+        collection = await self.db.collections.find_one({"collection_id": collection_id})
+        self._read_cache.set(key, collection, generation)
+        return collection
 
     async def get_collection_by_slug(self, slug: str) -> dict | None:
         """
@@ -301,11 +654,12 @@ class Database:
         Returns:
             True if updated successfully
         """
-        updates["updated_at"] = datetime.utcnow()
+        updates["updated_at"] = utcnow()
         result = await self.db.collections.update_one(
             {"collection_id": collection_id},
             {"$set": updates}
         )
+        self._read_cache.invalidate("collection", collection_id)
         return result.modified_count > 0
 
     async def list_collections(
@@ -325,10 +679,15 @@ class Database:
         Returns:
             List of collection documents
         """
-        await self._ensure_indexes()
         query = {"status": status.value} if status else {}
-        cursor = self.db.collections.find(query).skip(skip).limit(limit).sort("created_at", -1)
-        return await cursor.to_list(length=None)
+        cursor = (
+            self.db.collections.find(query)
+            .sort("created_at", -1)
+            .skip(skip)
+            .limit(limit)
+            .batch_size(limit)
+        )
+        return await cursor.to_list(length=limit)
 
     async def count_collections(self, status: CollectionStatus | None = None) -> int:
         """
@@ -1,7 +1,65 @@
+import asyncio
 import hashlib
-from datetime import datetime
+import hmac
+import io
+import mmap
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from typing import BinaryIO
-from app.models.metadata import FixityInfo, FixityAlgorithm
+from app.models.metadata import FixityInfo, FixityAlgorithm, utcnow
+
+
+def _create_hashers(algorithms: list[FixityAlgorithm] | None = None) -> dict:
+    """
+    Create hash objects for the given algorithms.
+
+    Args:
+        algorithms: List of algorithms to use (defaults to MD5 and SHA-256)
+
+    Returns:
+        Dictionary mapping algorithm names to hash objects
+    """
+    if algorithms is None:
+        algorithms = [FixityAlgorithm.MD5, FixityAlgorithm.SHA256]
+
+    hashers = {}
+    for algo in algorithms:
+        if algo == FixityAlgorithm.MD5:
+            hashers["md5"] = hashlib.md5()
+        elif algo == FixityAlgorithm.SHA256:
+            hashers["sha256"] = hashlib.sha256()
+        elif algo == FixityAlgorithm.SHA512:
+            hashers["sha512"] = hashlib.sha512()
+    return hashers
+
+
+# hashlib releases the GIL while hashing large buffers, so when several
+# algorithms are requested each chunk is fed to them on separate cores
+# instead of one after another. Not worth a thread hop for small chunks
+# or on a single core.
+_PARALLEL_HASHING = (os.cpu_count() or 1) > 1
+_PARALLEL_HASH_BYTES = 64 * 1024
+_hash_pool = ThreadPoolExecutor(thread_name_prefix="fixity")
+
+
+def _update_hashers(hashers: dict, data: bytes | bytearray | memoryview) -> None:
+    """
+    Update all hashers with the same chunk of data.
+
+    Args:
+        hashers: Dictionary of hash objects from _create_hashers
+        data: Chunk of file content
+    """
+    if _PARALLEL_HASHING and len(hashers) > 1 and len(data) >= _PARALLEL_HASH_BYTES:
+        first, *rest = hashers.values()
+        futures = [_hash_pool.submit(hasher.update, data) for hasher in rest]
+        first.update(data)
+        for future in futures:
+            future.result()
+    else:
+        for hasher in hashers.values():
+            hasher.update(data)
 
 
 class FixityService:
@@ -10,8 +68,8 @@ class FixityService:
     Implements stream-based processing to avoid loading entire files into memory.
     """
 
-    # Chunk size for reading files (8MB chunks)
-    CHUNK_SIZE = 8 * 1024 * 1024
+    # Chunk size for reading files (2MB chunks, read into a reused buffer)
+    CHUNK_SIZE = 2 * 1024 * 1024
 
     def __init__(self):
         pass
@@ -21,7 +79,9 @@ class FixityService:
     ) -> dict[str, str]:
         """
         Calculate checksums for a file stream using specified algorithms.
-        Stream-based processing to handle large files efficiently.
+        Stream-based processing to handle large files efficiently. Hashing
+        runs in a worker thread (hashlib releases the GIL on large updates)
+        so the event loop keeps serving other requests.
 
         Args:
             file_stream: Binary file stream to calculate checksums for
@@ -30,35 +90,15 @@ class FixityService:
         Returns:
             Dictionary mapping algorithm names to checksum values
         """
-        if algorithms is None:
-            algorithms = [FixityAlgorithm.MD5, FixityAlgorithm.SHA256]
-
-        # Initialize hash objects
-        hashers = {}
-        for algo in algorithms:
-            if algo == FixityAlgorithm.MD5:
-                hashers["md5"] = hashlib.md5()
-            elif algo == FixityAlgorithm.SHA256:
-                hashers["sha256"] = hashlib.sha256()
-            elif algo == FixityAlgorithm.SHA512:
-                hashers["sha512"] = hashlib.sha512()
-
-        # Read file in chunks and update all hashers
-        while True:
-            chunk = file_stream.read(self.CHUNK_SIZE)
-            if not chunk:
-                break
-            for hasher in hashers.values():
-                hasher.update(chunk)
-
-        # Return hexadecimal digest for each algorithm
-        return {name: hasher.hexdigest() for name, hasher in hashers.items()}
+        return await asyncio.to_thread(
+            self.calculate_checksums_sync, file_stream, algorithms
+        )
 
     def calculate_checksums_sync(
         self, file_stream: BinaryIO, algorithms: list[FixityAlgorithm] | None = None
     ) -> dict[str, str]:
         """
-        Synchronous version of calculate_checksums for compatibility.
+        Calculate checksums for a file stream, blocking the calling thread.
 
         Args:
             file_stream: Binary file stream to calculate checksums for
@@ -67,26 +107,23 @@ class FixityService:
         Returns:
             Dictionary mapping algorithm names to checksum values
         """
-        if algorithms is None:
-            algorithms = [FixityAlgorithm.MD5, FixityAlgorithm.SHA256]
-
-        # Initialize hash objects
-        hashers = {}
-        for algo in algorithms:
-            if algo == FixityAlgorithm.MD5:
-                hashers["md5"] = hashlib.md5()
-            elif algo == FixityAlgorithm.SHA256:
-                hashers["sha256"] = hashlib.sha256()
-            elif algo == FixityAlgorithm.SHA512:
-                hashers["sha512"] = hashlib.sha512()
-
-        # Read file in chunks and update all hashers
+        # Plain local files are hashed straight from a memory map. Only
+        # real file objects qualify: asking a SpooledTemporaryFile for its
+        # fileno() would force it to roll over to disk.
+        if isinstance(file_stream, (io.BufferedReader, io.FileIO)) and stat.S_ISREG(
+            os.fstat(file_stream.fileno()).st_mode
+        ):
+            return self._calculate_mapped_checksums(file_stream, algorithms)
+
+        hashers = _create_hashers(algorithms)
+
+        # Read file in chunks into one reused buffer and update all hashers
+        buffer = memoryview(bytearray(self.CHUNK_SIZE))
         while True:
-            chunk = file_stream.read(self.CHUNK_SIZE)
-            if not chunk:
+            n = file_stream.readinto(buffer)
+            if not n:
                 break
-            for hasher in hashers.values():
-                hasher.update(chunk)
+            _update_hashers(hashers, buffer[:n])
 
         # Return hexadecimal digest for each algorithm
         return {name: hasher.hexdigest() for name, hasher in hashers.items()}
@@ -121,7 +158,7 @@ class FixityService:
             checksum_md5=checksums["md5"],
             checksum_sha256=checksums["sha256"],
             algorithm=algorithms,
-            calculated_at=datetime.utcnow(),
+            calculated_at=utcnow(),
         )
 
     def verify_checksums(
@@ -142,7 +179,7 @@ class FixityService:
         for algo, expected_value in expected.items():
             if algo not in actual:
                 mismatches.append(f"{algo}: not calculated")
-            elif actual[algo] != expected_value:
+            elif not hmac.compare_digest(actual[algo], expected_value):
                 mismatches.append(
                     f"{algo}: expected {expected_value}, got {actual[algo]}"
                 )
@@ -166,8 +203,9 @@ class FixityService:
             FixityServiceError: If file cannot be read
         """
         try:
-            with open(file_path, "rb") as f:
-                return await self.calculate_checksums(f, algorithms)
+            return await asyncio.to_thread(
+                self._calculate_path_checksums, file_path, algorithms
+            )
         except FileNotFoundError:
             raise FixityServiceError(f"File not found: {file_path}")
         except PermissionError:
@@ -175,6 +213,104 @@ class FixityService:
         except Exception as e:
             raise FixityServiceError(f"Error calculating checksums: {str(e)}")
 
+    def _calculate_path_checksums(
+        self, file_path: str, algorithms: list[FixityAlgorithm] | None = None
+    ) -> dict[str, str]:
+        """Open a local file and calculate its checksums (blocking)."""
+        with open(file_path, "rb") as f:
+            return self.calculate_checksums_sync(f, algorithms)
+
+    def _calculate_mapped_checksums(
+        self, file: BinaryIO, algorithms: list[FixityAlgorithm] | None = None
+    ) -> dict[str, str]:
+        """
+        Calculate checksums for an open regular file through a read-only memory
+        map, so hashers read straight from the page cache without copying
+        each chunk into a Python buffer first.
+
+        Hashes from the current position to the end of the file and leaves
+        the file positioned at the end, like reading it would.
+
+        Args:
+            file: Local file opened in binary mode
+            algorithms: List of algorithms to use
+
+        Returns:
+            Dictionary mapping algorithm names to checksum values
+        """
+        hashers = _create_hashers(algorithms)
+        fd = file.fileno()
+        size = os.fstat(fd).st_size
+        start = file.tell()
+        if start >= size:
+            # Nothing left to read (empty files also cannot be mapped)
+            return {name: hasher.hexdigest() for name, hasher in hashers.items()}
+
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, start, 0, os.POSIX_FADV_SEQUENTIAL)
+
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                for offset in range(start, size, self.CHUNK_SIZE):
+                    _update_hashers(hashers, view[offset : offset + self.CHUNK_SIZE])
+            finally:
+                view.release()
+        file.seek(size)
+
+        return {name: hasher.hexdigest() for name, hasher in hashers.items()}
+
+
+class HashingReader:
+    """
+    Binary stream wrapper that calculates checksums as data is read.
+    Lets a file be hashed in the same pass that streams it to storage.
+    """
+
+    # Minimum bytes per hasher update (1MB). Small reads are coalesced so the
+    # per-call overhead of hashlib is amortized over large buffers.
+    READ_SIZE = 1 << 20
+
+    def __init__(
+        self, file_stream: BinaryIO, algorithms: list[FixityAlgorithm] | None = None
+    ):
+        self.file_stream = file_stream
+        self.size_bytes = 0
+        self._hashers = _create_hashers(algorithms)
+        self._pending = bytearray()
+
+    def read(self, size: int = -1) -> bytes:
+        """Read from the underlying stream and update all hashers"""
+        chunk = self.file_stream.read(size)
+        if chunk:
+            self.size_bytes += len(chunk)
+            if len(chunk) >= self.READ_SIZE:
+                self._flush()
+                self._update(chunk)
+            else:
+                self._pending += chunk
+                if len(self._pending) >= self.READ_SIZE:
+                    self._flush()
+        return chunk
+
+    def checksums(self) -> dict[str, str]:
+        """
+        Get checksums of everything read so far.
+
+        Returns:
+            Dictionary mapping algorithm names to checksum values
+        """
+        self._flush()
+        return {name: hasher.hexdigest() for name, hasher in self._hashers.items()}
+
+    def _update(self, data: bytes | bytearray) -> None:
+        _update_hashers(self._hashers, data)
+
+    def _flush(self) -> None:
+        if self._pending:
+            self._update(self._pending)
+            self._pending.clear()
+
 
 class FixityServiceError(Exception):
     """Exception raised by FixityService"""
@@ -3,6 +3,8 @@ Globus SDK integration for archive storage.
 Handles authentication, file queries, and verification.
 """
 
+import asyncio
+from functools import lru_cache
 from globus_sdk import (
     ConfidentialAppAuthClient,
     TransferClient,
@@ -14,6 +16,32 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Maximum concurrent directory listings when walking a tree
+DIRECTORY_WALK_WORKERS = 8
+
+
+@lru_cache(maxsize=8)
+def _transfer_client(client_id: str, client_secret: str) -> TransferClient:
+    """
+    Build an authenticated Transfer Client, shared by every GlobusService
+    using the same credentials. The authorizer refreshes its token itself.
+    """
+    # Use confidential app authentication (client credentials flow)
+    auth_client = ConfidentialAppAuthClient(
+        client_id=client_id,
+        client_secret=client_secret,
+    )
+
+    # Get client credentials authorizer
+    scopes = "urn:globus:auth:scope:transfer.api.globus.org:all"
+    cc_authorizer = ClientCredentialsAuthorizer(auth_client, scopes)
+
+    # Create transfer client
+    transfer_client = TransferClient(authorizer=cc_authorizer)
+
+    logger.info("Globus Transfer Client initialized successfully")
+    return transfer_client
+
 
 class GlobusService:
     """Service for interacting with Globus storage"""
@@ -33,22 +61,10 @@ class GlobusService:
             raise GlobusServiceError("Globus client_id and client_secret are required")
 
         try:
-            # Use confidential app authentication (client credentials flow)
-            auth_client = ConfidentialAppAuthClient(
-                client_id=self.settings.globus.client_id,
-                client_secret=self.settings.globus.client_secret,
+            return _transfer_client(
+                self.settings.globus.client_id, self.settings.globus.client_secret
             )
 
-            # Get client credentials authorizer
-            scopes = "urn:globus:auth:scope:transfer.api.globus.org:all"
-            cc_authorizer = ClientCredentialsAuthorizer(auth_client, scopes)
-
-            # Create transfer client
-            transfer_client = TransferClient(authorizer=cc_authorizer)
-
-            logger.info("Globus Transfer Client initialized successfully")
-            return transfer_client
-
         except Exception as e:
             logger.error(f"Failed to initialize Globus client: {e}")
             raise GlobusServiceError(f"Globus authentication failed: {str(e)}")
@@ -67,8 +83,9 @@ class GlobusService:
             # Build full path
             full_path = path if path.startswith("/") else f"{self.base_path}{path}"
 
-            # Use operation_ls to list directory
-            response = self.client.operation_ls(
+            # Use operation_ls to list directory (blocking SDK call, run off the loop)
+            response = await asyncio.to_thread(
+                self.client.operation_ls,
                 self.endpoint_id,
                 path=full_path,
             )
@@ -89,6 +106,45 @@ class GlobusService:
             logger.error(f"Failed to list directory {path}: {e}")
             raise GlobusServiceError(f"Failed to list directory: {str(e)}")
 
+    async def stat_directory(self, path: str) -> dict:
+        """
+        Count the files directly in a Globus directory and total their size.
+
+        Only files are requested from the endpoint (subdirectories are
+        filtered out server-side) and the listing is reduced in the worker
+        thread, so no per-file dictionaries are built.
+
+        Args:
+            path: Path relative to base_path or absolute path
+
+        Returns:
+            Dictionary with file count and total size in bytes
+        """
+        try:
+            # Build full path
+            full_path = path if path.startswith("/") else f"{self.base_path}{path}"
+
+            def _summarize() -> dict:
+                response = self.client.operation_ls(
+                    self.endpoint_id,
+                    path=full_path,
+                    filter="type:file",
+                )
+                count = 0
+                total_size = 0
+                for item in response:
+                    count += 1
+                    total_size += item.get("size", 0)
+                return {"count": count, "total_size": total_size}
+
+            stats = await asyncio.to_thread(_summarize)
+            logger.info(f"Stat {full_path}: {stats['count']} files, {stats['total_size']} bytes")
+            return stats
+
+        except TransferAPIError as e:
+            logger.error(f"Failed to stat directory {path}: {e}")
+            raise GlobusServiceError(f"Failed to stat directory: {str(e)}")
+
     async def get_file_info(self, path: str) -> dict:
         """
         Get metadata for a specific file.
@@ -99,43 +155,62 @@ class GlobusService:
         Returns:
             File metadata (size, modify_time, type, etc.)
         """
-        try:
-            # Build full path
-            full_path = path if path.startswith("/") else f"{self.base_path}{path}"
+        file_info = await self._stat_or_none(path)
+        if file_info is None:
+            logger.debug(f"Path not found: {path}")
+            raise GlobusServiceError(f"Failed to get file info: path not found: {path}")
+
+        logger.info(f"Retrieved file info for {path}")
+        return file_info
+
+    async def _stat_or_none(self, path: str) -> dict | None:
+        """
+        Get metadata for a path, or None if it does not exist.
+
+        Missing paths are an expected answer for existence checks, so they
+        are returned as None rather than raised. Other API errors still raise.
+
+        Args:
+            path: Full path to file or relative to base_path
+
+        Returns:
+            File metadata, or None if the path does not exist
+
+        Raises:
+            GlobusServiceError: If the stat fails for any other reason
+        """
+        # Build full path
+        full_path = path if path.startswith("/") else f"{self.base_path}{path}"
 
+        try:
             # Use operation_stat to get file info
-            response = self.client.operation_stat(
+            response = await asyncio.to_thread(
+                self.client.operation_stat,
                 self.endpoint_id,
                 path=full_path,
             )
-
-            file_info = {
-                "name": response["name"],
-                "type": response["type"],
-                "size": response.get("size", 0),
-                "modify_time": response.get("last_modified"),
-                "permissions": response.get("permissions"),
-            }
-
-            logger.info(f"Retrieved file info for {full_path}")
-            return file_info
-
         except TransferAPIError as e:
-            # Log 404s at debug level (often expected when checking existence)
-            # Log other errors at error level
-            if "404" in str(e) or "NotFound" in str(e):
-                logger.debug(f"Path not found: {path}")
-            else:
-                logger.error(f"Failed to get file info for {path}: {e}")
-            raise GlobusServiceError(f"Failed to get file info: {str(e)}")
+            if e.http_status == 404:
+                return None
+            logger.error(f"Failed to get file info for {path}: {e}")
+            raise GlobusServiceError(f"Failed to get file info: {str(e)}") from e
+
+        return {
+            "name": response["name"],
+            "type": response["type"],
+            "size": response.get("size", 0),
+            "modify_time": response.get("last_modified"),
+            "permissions": response.get("permissions"),
+        }
 
     async def verify_path_exists(self, path: str) -> bool:
         """Check if a path exists in Globus storage"""
-        try:
-            await self.get_file_info(path)
-            return True
-        except GlobusServiceError:
-            return False
+        return await self._stat_or_none(path) is not None
+
+    async def file_exists(self, path: str) -> bool:
+        """Check if a regular file exists in Globus storage (single stat call)"""
+        file_info = await self._stat_or_none(path)
+        return file_info is not None and file_info["type"] == "file"
 
     async def calculate_directory_size(self, path: str) -> int:
         """
@@ -148,16 +223,7 @@ class GlobusService:
             Total size in bytes
         """
         try:
-            files = await self.list_directory(path)
-            total_size = 0
-
-            for item in files:
-                if item["type"] == "file":
-                    total_size += item.get("size", 0)
-                elif item["type"] == "dir":
-                    # Recursively calculate subdirectory size
-                    subdir_path = f"{path}/{item['name']}" if not path.endswith("/") else f"{path}{item['name']}"
-                    total_size += await self.calculate_directory_size(subdir_path)
+            total_size = await self._walk_directory_size(path)
 
             logger.info(f"Calculated directory size for {path}: {total_size} bytes")
             return total_size
@@ -166,6 +232,56 @@ class GlobusService:
             logger.error(f"Failed to calculate directory size for {path}: {e}")
             raise GlobusServiceError(f"Failed to calculate directory size: {str(e)}")
 
+    async def _walk_directory_size(
+        self, root: str, workers: int = DIRECTORY_WALK_WORKERS
+    ) -> int:
+        """
+        Sum file sizes under a directory tree breadth-first.
+
+        A fixed pool of workers pulls directories from a shared queue, so
+        listings run with bounded concurrency and deep trees don't recurse.
+
+        Args:
+            root: Directory path to walk
+            workers: Maximum number of concurrent directory listings
+
+        Returns:
+            Total size in bytes
+        """
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        queue.put_nowait(root)
+        total_size = 0
+
+        async def worker() -> None:
+            nonlocal total_size
+            while True:
+                path = await queue.get()
+                try:
+                    for item in await self.list_directory(path):
+                        if item["type"] == "file":
+                            total_size += item.get("size", 0)
+                        elif item["type"] == "dir":
+                            queue.put_nowait(f"{path.rstrip('/')}/{item['name']}")
+                finally:
+                    queue.task_done()
+
+        tasks = [asyncio.create_task(worker()) for _ in range(workers)]
+        finished = asyncio.create_task(queue.join())
+        try:
+            done, _ = await asyncio.wait(
+                [finished, *tasks], return_when=asyncio.FIRST_COMPLETED
+            )
+            # Workers only return by raising, so surface the first failure
+            for task in done:
+                if task is not finished:
+                    task.result()
+        finally:
+            for task in (finished, *tasks):
+                task.cancel()
+            await asyncio.gather(finished, *tasks, return_exceptions=True)
+
+        return total_size
+
     async def create_directory(self, path: str, create_parents: bool = True) -> bool:
         """
         Create a directory in Globus storage.
@@ -182,14 +298,9 @@ class GlobusService:
             full_path = path if path.startswith("/") else f"{self.base_path}{path}"
 
             # Check if directory already exists
-            try:
-                info = await self.get_file_info(full_path)
-                if info["type"] == "dir":
-                    logger.info(f"Directory already exists: {full_path}")
-                    return True
-            except GlobusServiceError:
-                # Directory doesn't exist, create it
-                pass
+            if await self._is_directory(full_path):
+                logger.info(f"Directory already exists: {full_path}")
+                return True
 
             # Create parent directories if needed
             if create_parents:
@@ -198,7 +309,8 @@ class GlobusService:
                     await self._ensure_parent_directories(parent_path)
 
             # Use operation_mkdir to create directory
-            self.client.operation_mkdir(
+            await asyncio.to_thread(
+                self.client.operation_mkdir,
                 self.endpoint_id,
                 path=full_path,
             )
@@ -217,34 +329,52 @@ class GlobusService:
 
     async def _ensure_parent_directories(self, path: str) -> None:
         """
-        Recursively ensure all parent directories exist.
+        Ensure a directory and all of its ancestors exist.
+
+        Probes deepest-first and stops at the first directory that exists,
+        so the common case (parent already there) costs one stat. Only the
+        missing tail below it is then created, in order.
 
         Args:
             path: Full directory path to ensure exists
         """
-        # Check if path exists
-        try:
-            info = await self.get_file_info(path)
-            if info["type"] == "dir":
-                return  # Already exists
-        except GlobusServiceError:
-            pass  # Doesn't exist, need to create
+        parts = [part for part in path.strip("/").split("/") if part]
+        ancestors = ["/" + "/".join(parts[: i + 1]) for i in range(len(parts))]
 
-        # Get parent path
-        parent_path = "/".join(path.rstrip("/").split("/")[:-1])
+        missing_from = 0
+        for i in range(len(ancestors) - 1, -1, -1):
+            if await self._parent_exists(ancestors[i]):
+                missing_from = i + 1
+                break
 
-        # Recursively ensure parent exists (but stop at root)
-        if parent_path and parent_path != "/":
-            await self._ensure_parent_directories(parent_path)
+        for ancestor in ancestors[missing_from:]:
+            try:
+                await asyncio.to_thread(self.client.operation_mkdir, self.endpoint_id, path=ancestor)
+                logger.info(f"Created parent directory: {ancestor}")
+            except TransferAPIError as e:
+                # Ignore if already exists
+                if "exists" not in str(e).lower() and "file exists" not in str(e).lower():
+                    raise
+
+    async def _parent_exists(self, path: str) -> bool:
+        """
+        Check if a parent directory exists while walking up a path.
 
-        # Create this directory
+        A path the service account may not list (403, e.g. a top-level
+        mount such as /archive) is taken to exist, as nothing can be
+        created there anyway.
+        """
         try:
-            self.client.operation_mkdir(self.endpoint_id, path=path)
-            logger.info(f"Created parent directory: {path}")
-        except TransferAPIError as e:
-            # Ignore if already exists
-            if "exists" not in str(e).lower() and "file exists" not in str(e).lower():
-                raise
+            return await self._is_directory(path)
+        except GlobusServiceError as e:
+            if isinstance(e.__cause__, TransferAPIError) and e.__cause__.http_status == 403:
+                return True
+            raise
+
+    async def _is_directory(self, path: str) -> bool:
+        """Check if a path exists and is a directory"""
+        info = await self._stat_or_none(path)
+        return info is not None and info["type"] == "dir"
 
     async def check_required_files(self, path: str, required_files: list[str]) -> dict[str, bool]:
         """
@@ -259,9 +389,17 @@ class GlobusService:
         """
         try:
             files = await self.list_directory(path)
-            file_names = {f["name"] for f in files if f["type"] == "file"}
 
-            results = {filename: filename in file_names for filename in required_files}
+            # Single pass over the listing, stopping once every required
+            # file has been seen
+            missing = set(required_files)
+            for f in files:
+                if f["type"] == "file" and f["name"] in missing:
+                    missing.discard(f["name"])
+                    if not missing:
+                        break
+
+            results = {filename: filename not in missing for filename in required_files}
 
             logger.info(f"Checked required files in {path}: {results}")
             return results
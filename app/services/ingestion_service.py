@@ -1,11 +1,10 @@
-import os
-import io
-from datetime import datetime
+import asyncio
 from typing import BinaryIO
 from fastapi import UploadFile
 
 from app.models.ingestion import IngestionMetadata, IngestionResponse
 from app.models.metadata import (
+    utcnow,
     Artifact,
     ArtifactCreate,
     ArtifactStatus,
@@ -15,7 +14,7 @@ from app.models.metadata import (
     PreservationEventOutcome,
 )
 from app.services.db import Database
-from app.services.fixity_service import FixityService
+from app.services.fixity_service import FixityService, HashingReader
 from app.services.storage_location_service import StorageLocationService
 from app.services.preservation_event_service import PreservationEventService
 from app.services.object_storage import ObjectStorage
@@ -54,13 +53,12 @@ class IngestionService:
         This is the main entry point for artifact ingestion.
 
         Process:
-        1. Validate metadata
-        2. Calculate checksums while streaming to storage
-        3. Create artifact record with PROCESSING status
-        4. Store file to hot storage (MinIO)
-        5. Register storage location
-        6. Log ingestion event
-        7. Return artifact ID and status
+        1. Create artifact record with UPLOADING status
+        2. Stream file to hot storage (MinIO), calculating checksums in the same pass
+        3. Register storage location
+        4. Log ingestion event
+        5. Record fixity information and update status
+        6. Return artifact ID and status
 
         Args:
             file: Uploaded file
@@ -73,63 +71,65 @@ class IngestionService:
         Raises:
             IngestionServiceError: If ingestion fails at any step
         """
+        artifact_id: str | None = None
         try:
-            # Step 1: Read file content and calculate checksums
-            file_content = await file.read()
-            file_stream = io.BytesIO(file_content)
-            file_size = len(file_content)
-
-            checksums = self.fixity_service.calculate_checksums_sync(file_stream)
-            fixity_info = self.fixity_service.generate_fixity_info(checksums)
-
-            # Step 2: Create initial artifact record with PROCESSING status
-            artifact = await self._create_artifact_record(metadata, fixity_info)
+            # Step 1: Create initial artifact record with UPLOADING status
+            artifact = await self._create_artifact_record(metadata)
             result = await self.db.insert_artifact("artifacts", artifact)
             artifact_id = result["id"]
 
-            # Step 3: Upload to hot storage (MinIO)
+            # Step 2: Stream to hot storage (MinIO), hashing as the file is read
             storage_path = self.storage_location_service.build_storage_path(
                 artifact_id=artifact_id,
                 filename=file.filename or "artifact",
                 storage_type=StorageType.HOT,
             )
 
-            # Reset stream for upload
-            file_stream.seek(0)
-
-            # Upload to MinIO
+            await file.seek(0)
+            file_stream = HashingReader(file.file)
             await self._upload_to_storage(
                 file_stream=file_stream,
                 storage_path=storage_path,
                 metadata=metadata,
+                length=file.size if file.size is not None else -1,
             )
 
-            # Step 4: Register storage location
-            await self.storage_location_service.register_location(
-                artifact_id=artifact_id,
+            checksums = file_stream.checksums()
+            fixity_info = self.fixity_service.generate_fixity_info(checksums)
+
+            # Steps 3-5: Register storage location, log ingestion event,
+            # record fixity and update status to READY (or PROCESSING if
+            # background tasks are needed), all in one database write
+            location = self.storage_location_service.build_location(
                 storage_type=StorageType.HOT,
                 path=storage_path,
-                size_bytes=file_size,
+                size_bytes=file_stream.size_bytes,
                 checksum_md5=checksums["md5"],
                 checksum_sha256=checksums["sha256"],
                 bucket=self.settings.storage.bucket,
                 endpoint=self.settings.storage.endpoint,
             )
-
-            # Step 5: Log ingestion event
-            await self.preservation_event_service.log_ingestion(
-                artifact_id=artifact_id,
+            event = self.preservation_event_service.build_ingestion_event(
                 outcome=PreservationEventOutcome.SUCCESS,
                 storage_path=storage_path,
                 agent=agent,
             )
 
-            # Step 6: Update status to READY (or PROCESSING if background tasks are needed)
             final_status = ArtifactStatus.READY
             if self.settings.processing.enable_metadata_extraction:
                 final_status = ArtifactStatus.PROCESSING
 
-            await self.db.update_artifact_status(artifact_id, final_status)
+            await self.db.add_location_and_event(
+                artifact_id,
+                location,
+                event,
+                updates={
+                    "status": final_status.value,
+                    "fixity": fixity_info.model_dump(mode="python"),
+                    "archival_info.checksum": fixity_info.checksum_sha256,
+                    "archival_info.storage_location": storage_path,
+                },
+            )
 
             return IngestionResponse(
                 artifact_id=artifact_id,
@@ -139,28 +139,27 @@ class IngestionService:
             )
 
         except Exception as e:
-            # Log failure event if artifact was created
-            if "artifact_id" in locals():
-                await self.preservation_event_service.log_event(
-                    artifact_id=artifact_id,
+            # Log failure event and mark FAILED in one write if artifact was created
+            if artifact_id is not None:
+                event = self.preservation_event_service.build_event(
                     event_type=PreservationEventType.INGESTION,
                     outcome=PreservationEventOutcome.FAILURE,
                     agent=agent,
                     detail=f"Ingestion failed: {str(e)}",
                 )
-                await self.db.update_artifact_status(artifact_id, ArtifactStatus.FAILED)
+                await self.db.add_preservation_event(
+                    artifact_id, event, updates={"status": ArtifactStatus.FAILED.value}
+                )
 
             raise IngestionServiceError(f"Ingestion failed: {str(e)}")
 
-    async def _create_artifact_record(
-        self, metadata: IngestionMetadata, fixity_info
-    ) -> Artifact:
+    async def _create_artifact_record(self, metadata: IngestionMetadata) -> Artifact:
         """
         Create an Artifact record from user-submitted metadata.
+        Fixity information is recorded once the upload completes.
 
         Args:
             metadata: User-submitted ingestion metadata
-            fixity_info: Calculated fixity information
 
         Returns:
             Artifact object
@@ -168,15 +167,16 @@ class IngestionService:
         # Build archival info
         archival_info = ArchivalInfo(
             creation_date=metadata.creation_date,
-            checksum=fixity_info.checksum_sha256,
             storage_location="pending",  # Will be updated after upload
         )
 
+        now = utcnow()
+
         # Create ArtifactCreate model
         artifact_create = ArtifactCreate(
             title=metadata.title,
             description=metadata.description,
-            recorded_date=datetime.utcnow().isoformat(),
+            recorded_date=now.isoformat(),
             archival_info=archival_info,
             content=metadata.content,
             licensing=metadata.licensing,
@@ -185,12 +185,11 @@ class IngestionService:
 
         # Create Artifact with preservation metadata
         artifact = Artifact.create(artifact_create)
-        artifact.status = ArtifactStatus.PROCESSING
-        artifact.fixity = fixity_info
+        artifact.status = ArtifactStatus.UPLOADING
         artifact.processing_metadata = {
             "creator": metadata.creator,
             "notes": metadata.notes,
-            "ingestion_start": datetime.utcnow().isoformat(),
+            "ingestion_start": now.isoformat(),
         }
 
         return artifact
@@ -200,41 +199,42 @@ class IngestionService:
         file_stream: BinaryIO,
         storage_path: str,
         metadata: IngestionMetadata,
+        length: int = -1,
     ) -> None:
         """
-        Upload file to object storage.
+        Stream file to object storage as a multipart upload.
+        The blocking MinIO client runs in a worker thread. Parts are read
+        sequentially (so checksums see bytes in order) and uploaded in
+        parallel; MinIO blocks reading further parts while all upload slots
+        are busy, capping memory at roughly concurrency x part size.
 
         Args:
             file_stream: File content as stream
             storage_path: Path in storage
             metadata: User metadata for S3 metadata tags
+            length: File size in bytes, or -1 if unknown
 
         Raises:
             IngestionServiceError: If upload fails
         """
         try:
-            # Save stream to temporary file for minio upload
-            temp_path = f"/tmp/{os.path.basename(storage_path)}"
-            with open(temp_path, "wb") as f:
-                f.write(file_stream.read())
-
-            # Upload to MinIO
             storage_metadata = {
                 "title": metadata.title,
                 "creator": metadata.creator,
                 "creation-date": metadata.creation_date,
             }
 
-            self.storage.upload_file(
+            await asyncio.to_thread(
+                self.storage.upload_stream,
                 bucket=self.settings.storage.bucket,
-                file_path=temp_path,
+                stream=file_stream,
                 s3_path=storage_path,
+                length=length,
+                part_size=self.settings.storage.part_size_mb * 1024 * 1024,
+                num_parallel_uploads=self.settings.storage.upload_concurrency,
                 meta=storage_metadata,
             )
 
-            # Clean up temp file
-            os.remove(temp_path)
-
         except Exception as e:
             raise IngestionServiceError(f"Storage upload failed: {str(e)}")
 
@@ -260,7 +260,15 @@ class IngestionService:
         Returns:
             Dictionary with status information
         """
-        artifact = await self.db.get_artifact(artifact_id)
+        artifact = await self.db.get_artifact(
+            artifact_id,
+            projection={
+                "status": 1,
+                "processing_metadata": 1,
+                "created_at": 1,
+                "updated_at": 1,
+            },
+        )
         if not artifact:
             raise IngestionServiceError(f"Artifact not found: {artifact_id}")
 
@@ -4,7 +4,9 @@ from app.models.metadata import (
     AudioMetadata,
     Duration,
 )
+import asyncio
 import ffmpeg
+import orjson
 import os
 
 
@@ -16,16 +18,50 @@ class MetadataService:
     def __init__(self):
         pass
 
-    def __validate_file(self, file: str):
-        """Validates a file
+    async def _probe(self, file: str, select_streams: str) -> dict:
+        """Runs ffprobe on a file, reporting only the selected stream
+
+        ffprobe runs as an asyncio subprocess so probes don't block the
+        event loop and several files can be probed at once. A missing file
+        is reported by ffprobe itself, so no separate existence check is
+        made beforehand.
 
         Args:
             file: file or path to the file.
+            select_streams: ffprobe stream specifier (e.g. "v:0").
         """
-        if not os.path.exists(file):
+        proc = await asyncio.create_subprocess_exec(
+            "ffprobe",
+            "-v", "error",
+            "-print_format", "json",
+            "-show_format",
+            "-show_streams",
+            "-select_streams", select_streams,
+            file,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        out, err = await proc.communicate()
+        if proc.returncode != 0:
+            if not os.path.exists(file):
+                raise MetadataServiceError(
+                    "Could not find file. Please ensure path is correct."
+                )
             raise MetadataServiceError(
-                "Could not find file. Please ensure path is correct."
+                f"Could not probe file: {err.decode(errors='replace')}"
             )
+        return orjson.loads(out)
+
+    def _size_in_mb(self, file: str, data: dict) -> float:
+        """Container size from the probe result, in MB
+
+        Args:
+            file: file or path to the file (stat fallback if the probe has no size).
+            data: ffprobe output.
+        """
+        size = data.get("format", {}).get("size")
+        size_bytes = int(size) if size is not None else os.path.getsize(file)
+        return round(size_bytes / (1024 * 1024), 2)
 
     async def extract_audio_to_bytes(self, input_video: str) -> bytes:
         """Extract the video as audio bytes
@@ -33,49 +69,69 @@ class MetadataService:
         Args:
             the input_video: the file path to the video.
         """
-        out, _ = (
+        args = (
             ffmpeg.input(input_video)
             .output("pipe:", format="wav", acodec="pcm_s16le", ar="16000")
-            .run(capture_stdout=True, capture_stderr=True)
+            .compile()
+        )
+        proc = await asyncio.create_subprocess_exec(
+            *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
         )
+        out, err = await proc.communicate()
+        if proc.returncode != 0:
+            raise MetadataServiceError(
+                f"Could not extract audio: {err.decode(errors='replace')}"
+            )
         return out
 
-    def extract(self, file: str) -> Artifact:
+    async def extract(self, file: str) -> Artifact:
         """Extracts a file to its corresponding Metadata object.
 
         Args:
             file: a file or path to a file.
         """
         file_type = file.split(".")[-1].lower()
-        self.__validate_file(file)
 
         if file_type in self.VIDEO_TYPES:
-            return self._video_to_metadata(file, file_type)
+            return await self._video_to_metadata(file, file_type)
 
         elif file_type in self.AUDIO_TYPES:
-            return self._audio_to_metadata(file)
+            return await self._audio_to_metadata(file)
+
+    def _parse_frame_rate(self, rate: str) -> float:
+        """Parses an ffprobe rational frame rate such as "30000/1001"
 
-    def _video_to_metadata(self, file: str, file_type: str) -> VideoMetadata:
+        Args:
+            rate: the "num/den" frame rate string.
+        """
+        num, _, den = rate.partition("/")
+        try:
+            numerator = float(num)
+            denominator = float(den) if den else 1.0
+        except ValueError:
+            raise MetadataServiceError(f"Invalid frame rate: {rate}")
+        if denominator == 0:
+            return 0.0
+        return round(numerator / denominator, 2)
+
+    async def _video_to_metadata(self, file: str, file_type: str) -> VideoMetadata:
         """
         Convert video probe to proper metadata
 
         Args:
             file: the video file location.
         """
-        data = ffmpeg.probe(file)
-        video_meta: dict = next(
-            (stream for stream in data["streams"] if stream["codec_type"] == "video"),
-            None,
-        )
-        if not video_meta:
+        data = await self._probe(file, select_streams="v:0")
+        if not data["streams"]:
             raise MetadataServiceError("Could not evaluate the file as a video.")
-        fps = round(float(eval(video_meta.get("r_frame_rate", "0/1"))), 2)
+        video_meta: dict = data["streams"][0]
+        fps = self._parse_frame_rate(video_meta.get("r_frame_rate", "0/1"))
         secs = round(float(video_meta.get("duration")), 0)
         width = video_meta.get("width")
         height = video_meta.get("height")
         codec = video_meta.get("codec_name")
         # get size in mb
-        size_in_mb = round((os.path.getsize(file) / (1024 * 1024)), 2)
+        size_in_mb = self._size_in_mb(file, data)
         duration = Duration(seconds=secs)
 
         return VideoMetadata(
@@ -88,14 +144,16 @@ class MetadataService:
             file_size_mb=size_in_mb,
         )
 
-    def _audio_to_metadata(self, file: str) -> AudioMetadata:
+    async def _audio_to_metadata(self, file: str) -> AudioMetadata:
         """
         Convert audio formats probe to proper metadata
 
         Args:
             file: the audio file location.
         """
-        data: dict = ffmpeg.probe(file)
+        data: dict = await self._probe(file, select_streams="a:0")
+        if not data["streams"]:
+            raise MetadataServiceError("Could not evaluate the file as audio.")
         audio_meta: dict = data["streams"][0]
         channels = audio_meta.get("channels")
         sample_rate = audio_meta.get("sample_rate")
@@ -103,7 +161,7 @@ class MetadataService:
         codec = audio_meta.get("codec_name")
         duration = Duration(seconds=secs)
         # get size in mb
-        size_in_mb = round((os.path.getsize(file) / (1024 * 1024)), 2)
+        size_in_mb = self._size_in_mb(file, data)
 
         return AudioMetadata(
             channels=channels,
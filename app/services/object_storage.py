@@ -1,5 +1,18 @@
 import os
+from typing import BinaryIO
+import certifi
+import urllib3
 from minio import Minio
+from urllib3.util import Retry, Timeout
+from app.services.fixity_service import HashingReader
+
+# Multipart defaults for local file uploads
+UPLOAD_PART_SIZE = 32 * 1024 * 1024
+UPLOAD_PARALLEL_PARTS = 4
+
+# MinIO's own HTTP client defaults, apart from the pool size
+_HTTP_TIMEOUT = 5 * 60
+_HTTP_RETRIES = Retry(total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504])
 
 
 class ObjectStorage:
@@ -13,6 +26,7 @@ class ObjectStorage:
         region: str | None = None,
         bucket: str | None = None,
         secure: bool = True,
+        max_connections: int = 10,
     ):
         self.bucket = bucket
         endpoint = endpoint if endpoint else os.getenv("AWS_S3_ENDPOINT", None)
@@ -27,16 +41,39 @@ class ObjectStorage:
             msg = "Default variables must be set or specified in parameters of ObjectStorage."
             raise ObjectStorageError(msg)
 
+        # Keep-alive pool sized for concurrent multipart uploads; MinIO's
+        # default keeps only 10 connections and discards the rest
+        http_client = urllib3.PoolManager(
+            timeout=Timeout(connect=_HTTP_TIMEOUT, read=_HTTP_TIMEOUT),
+            maxsize=max_connections,
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+            retries=_HTTP_RETRIES,
+        )
+
         self.client = Minio(
             endpoint=endpoint,
             access_key=access_key,
             secret_key=secret_key,
             region=region,
             secure=secure,
+            http_client=http_client,
         )
 
-    def upload_file(self, bucket: str, file_path: str, s3_path: str, *, meta: dict):
-        """Upload file to S3
+    def upload_file(
+        self,
+        bucket: str,
+        file_path: str,
+        s3_path: str,
+        *,
+        meta: dict,
+        part_size: int = UPLOAD_PART_SIZE,
+        num_parallel_uploads: int = UPLOAD_PARALLEL_PARTS,
+    ) -> tuple[dict[str, str], int]:
+        """Upload file to S3 as a multipart upload with parts sent concurrently
+
+        The file is hashed as it is read for upload, so registering its
+        storage location does not need a second pass over the file.
 
         Args:
             bucket: the bucket name
@@ -44,9 +81,56 @@ class ObjectStorage:
             s3_path: the S3 path to save to
 
         Keyword Args:
+            meta: the dictionary of metadata
+            part_size: the multipart part size in bytes
+            num_parallel_uploads: the number of parts uploaded concurrently
+
+        Returns:
+            Tuple of (checksums by algorithm name, size in bytes)"""
+        with open(file_path, "rb") as f:
+            stream = HashingReader(f)
+            self.upload_stream(
+                bucket,
+                stream,
+                s3_path,
+                length=os.fstat(f.fileno()).st_size,
+                part_size=part_size,
+                num_parallel_uploads=num_parallel_uploads,
+                meta=meta,
+            )
+        return stream.checksums(), stream.size_bytes
+
+    def upload_stream(
+        self,
+        bucket: str,
+        stream: BinaryIO,
+        s3_path: str,
+        *,
+        length: int = -1,
+        part_size: int,
+        num_parallel_uploads: int = 1,
+        meta: dict,
+    ):
+        """Stream data to S3 as a multipart upload
+
+        Args:
+            bucket: the bucket name
+            stream: a readable binary stream
+            s3_path: the S3 path to save to
+
+        Keyword Args:
+            length: the stream size in bytes, or -1 if unknown
+            part_size: the multipart part size in bytes
+            num_parallel_uploads: the number of parts uploaded concurrently
             meta: the dictionary of metadata"""
-        self.client.fput_object(
-            bucket_name=bucket, file_path=file_path, object_name=s3_path, metadata=meta
+        self.client.put_object(
+            bucket_name=bucket,
+            object_name=s3_path,
+            data=stream,
+            length=length,
+            part_size=part_size,
+            num_parallel_uploads=num_parallel_uploads,
+            metadata=meta,
         )
 
     def download_file(self, bucket: str, file_path: str, s3_path: str):
@@ -1,5 +1,8 @@
-from datetime import datetime
+from functools import lru_cache
+from typing import Iterable
 from app.models.metadata import (
+    utcnow,
+    PRESERVATION_EVENT_LIST_ADAPTER,
     PreservationEvent,
     PreservationEventType,
     PreservationEventOutcome,
@@ -7,6 +10,15 @@ from app.models.metadata import (
 from app.services.db import Database
 
 
+@lru_cache(maxsize=64)
+def _fixity_detail(algorithms: tuple[str, ...], checksums_match: bool) -> str:
+    """Fixity event detail; sweeps repeat the same few algorithm sets"""
+    return (
+        f"Fixity check using {', '.join(algorithms)}. "
+        f"Result: {'checksums match' if checksums_match else 'checksum mismatch'}"
+    )
+
+
 class PreservationEventService:
     """
     Service for logging and managing PREMIS-compliant preservation events.
@@ -42,11 +54,10 @@ class PreservationEventService:
         Raises:
             PreservationEventServiceError: If logging fails
         """
-        event = PreservationEvent(
+        event = self.build_event(
             event_type=event_type,
-            timestamp=datetime.utcnow(),
-            agent=agent,
             outcome=outcome,
+            agent=agent,
             detail=detail,
             related_object=related_object,
         )
@@ -60,18 +71,47 @@ class PreservationEventService:
 
         return event
 
-    async def log_ingestion(
+    def build_event(
+        self,
+        event_type: PreservationEventType,
+        outcome: PreservationEventOutcome,
+        agent: str = "system",
+        detail: str | None = None,
+        related_object: str | None = None,
+    ) -> PreservationEvent:
+        """
+        Build a preservation event without writing it, for callers that
+        persist it together with other artifact updates.
+
+        Args:
+            event_type: Type of preservation event
+            outcome: Outcome of the event (success/failure/warning)
+            agent: Agent that performed the event (defaults to "system")
+            detail: Additional details about the event
+            related_object: Related object identifier
+
+        Returns:
+            PreservationEvent object
+        """
+        return PreservationEvent(
+            event_type=event_type,
+            timestamp=utcnow(),
+            agent=agent,
+            outcome=outcome,
+            detail=detail,
+            related_object=related_object,
+        )
+
+    def build_ingestion_event(
         self,
-        artifact_id: str,
         outcome: PreservationEventOutcome,
         storage_path: str,
         agent: str = "system",
     ) -> PreservationEvent:
         """
-        Log an ingestion event (convenience method).
+        Build an ingestion event without writing it.
 
         Args:
-            artifact_id: Artifact identifier
             outcome: Outcome of the ingestion
             storage_path: Path where artifact was stored
             agent: Agent that performed ingestion
@@ -79,16 +119,43 @@ class PreservationEventService:
         Returns:
             PreservationEvent object
         """
-        detail = f"Artifact ingested to storage path: {storage_path}"
-        return await self.log_event(
-            artifact_id=artifact_id,
+        return self.build_event(
             event_type=PreservationEventType.INGESTION,
             outcome=outcome,
             agent=agent,
-            detail=detail,
+            detail=f"Artifact ingested to storage path: {storage_path}",
             related_object=storage_path,
         )
 
+    async def log_ingestion(
+        self,
+        artifact_id: str,
+        outcome: PreservationEventOutcome,
+        storage_path: str,
+        agent: str = "system",
+    ) -> PreservationEvent:
+        """
+        Log an ingestion event (convenience method).
+
+        Args:
+            artifact_id: Artifact identifier
+            outcome: Outcome of the ingestion
+            storage_path: Path where artifact was stored
+            agent: Agent that performed ingestion
+
+        Returns:
+            PreservationEvent object
+        """
+        event = self.build_ingestion_event(outcome, storage_path, agent)
+        try:
+            await self.db.add_preservation_event(artifact_id, event)
+        except Exception as e:
+            raise PreservationEventServiceError(
+                f"Failed to log preservation event: {str(e)}"
+            )
+
+        return event
+
     async def log_validation(
         self,
         artifact_id: str,
@@ -138,16 +205,11 @@ class PreservationEventService:
         Returns:
             PreservationEvent object
         """
-        detail = (
-            f"Fixity check using {', '.join(algorithms)}. "
-            f"Result: {'checksums match' if checksums_match else 'checksum mismatch'}"
-        )
-
         return await self.log_event(
             artifact_id=artifact_id,
             event_type=PreservationEventType.FIXITY_CHECK,
             outcome=outcome,
-            detail=detail,
+            detail=_fixity_detail(tuple(algorithms), checksums_match),
         )
 
     async def log_replication(
@@ -213,13 +275,16 @@ class PreservationEventService:
         self,
         artifact_id: str,
         event_type: PreservationEventType | None = None,
+        event_types: Iterable[PreservationEventType] | None = None,
     ) -> list[PreservationEvent]:
         """
         Get preservation events for an artifact.
+        Filtering happens in the database, not in Python.
 
         Args:
             artifact_id: Artifact identifier
             event_type: Filter by event type (optional)
+            event_types: Filter by any of several event types (optional)
 
         Returns:
             List of PreservationEvent objects
@@ -228,18 +293,15 @@ class PreservationEventService:
             PreservationEventServiceError: If retrieval fails
         """
         try:
-            artifact = await self.db.get_artifact(artifact_id)
-            if not artifact:
+            events = await self.db.get_preservation_events(
+                artifact_id, event_type, event_types=event_types
+            )
+            if events is None:
                 raise PreservationEventServiceError(
                     f"Artifact not found: {artifact_id}"
                 )
 
-            events = artifact.get("preservation_events", [])
-
-            if event_type:
-                events = [e for e in events if e.get("event_type") == event_type.value]
-
-            return [PreservationEvent(**e) for e in events]
+            return PRESERVATION_EVENT_LIST_ADAPTER.validate_python(events)
         except Exception as e:
             raise PreservationEventServiceError(
                 f"Failed to retrieve preservation events: {str(e)}"
@@ -258,13 +320,21 @@ class PreservationEventService:
         Returns:
             PreservationEvent object or None if not found
         """
-        events = await self.get_events(artifact_id, event_type)
+        try:
+            events = await self.db.get_preservation_events(
+                artifact_id, event_type, limit=1
+            )
+        except Exception as e:
+            raise PreservationEventServiceError(
+                f"Failed to retrieve preservation events: {str(e)}"
+            )
+
+        if events is None:
+            raise PreservationEventServiceError(f"Artifact not found: {artifact_id}")
         if not events:
             return None
 
-        # Sort by timestamp descending and return first
-        events.sort(key=lambda e: e.timestamp, reverse=True)
-        return events[0]
+        return PreservationEvent(**events[0])
 
 
 class PreservationEventServiceError(Exception):
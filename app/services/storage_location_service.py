@@ -1,5 +1,5 @@
 from datetime import datetime
-from app.models.metadata import StorageLocation, StorageType
+from app.models.metadata import StorageLocation, StorageType, utcnow
 from app.services.db import Database
 
 
@@ -42,15 +42,14 @@ class StorageLocationService:
         Raises:
             StorageLocationServiceError: If registration fails
         """
-        location = StorageLocation(
+        location = self.build_location(
             storage_type=storage_type,
             path=path,
-            bucket=bucket,
-            endpoint=endpoint,
             size_bytes=size_bytes,
             checksum_md5=checksum_md5,
             checksum_sha256=checksum_sha256,
-            created_at=datetime.utcnow(),
+            bucket=bucket,
+            endpoint=endpoint,
         )
 
         # Add location to artifact's storage_locations list
@@ -63,6 +62,43 @@ class StorageLocationService:
 
         return location
 
+    def build_location(
+        self,
+        storage_type: StorageType,
+        path: str,
+        size_bytes: int,
+        checksum_md5: str,
+        checksum_sha256: str,
+        bucket: str | None = None,
+        endpoint: str | None = None,
+    ) -> StorageLocation:
+        """
+        Build a storage location without writing it, for callers that
+        persist it together with other artifact updates.
+
+        Args:
+            storage_type: Type of storage (hot/archive)
+            path: Path to the file in storage
+            size_bytes: File size in bytes
+            checksum_md5: MD5 checksum
+            checksum_sha256: SHA-256 checksum
+            bucket: Bucket name (for S3/MinIO)
+            endpoint: Storage endpoint or Globus endpoint ID
+
+        Returns:
+            StorageLocation object
+        """
+        return StorageLocation(
+            storage_type=storage_type,
+            path=path,
+            bucket=bucket,
+            endpoint=endpoint,
+            size_bytes=size_bytes,
+            checksum_md5=checksum_md5,
+            checksum_sha256=checksum_sha256,
+            created_at=utcnow(),
+        )
+
     async def get_locations(self, artifact_id: str) -> list[StorageLocation]:
         """
         Get all storage locations for an artifact.
@@ -77,7 +113,9 @@ class StorageLocationService:
             StorageLocationServiceError: If retrieval fails
         """
         try:
-            artifact = await self.db.get_artifact(artifact_id)
+            artifact = await self.db.get_artifact(
+                artifact_id, projection={"storage_locations": 1}
+            )
             if not artifact:
                 raise StorageLocationServiceError(
                     f"Artifact not found: {artifact_id}"
@@ -122,7 +160,7 @@ class StorageLocationService:
         """
         try:
             await self.db.update_storage_location_verification(
-                artifact_id, storage_type, datetime.utcnow()
+                artifact_id, storage_type, utcnow()
             )
         except Exception as e:
             raise StorageLocationServiceError(
@@ -184,13 +222,10 @@ class StorageLocationService:
             Storage path string
         """
         if date is None:
-            date = datetime.utcnow()
-
-        year = date.strftime("%Y")
-        month = date.strftime("%m")
+            date = utcnow()
 
         # Format: artifacts/YYYY/MM/artifact_id/filename
-        return f"artifacts/{year}/{month}/{artifact_id}/{filename}"
+        return f"artifacts/{date.year:04d}/{date.month:02d}/{artifact_id}/{filename}"
 
 
 class StorageLocationServiceError(Exception):
@@ -1,5 +1,9 @@
+from typing import BinaryIO
 import httpx
 
+# Connection pool for the ASR service, shared by every transcribe call
+ASR_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+
 
 class Transcription:
     """Transcription Service"""
@@ -11,37 +15,54 @@ class Transcription:
             api: the link to the API service
         """
         self.api = api
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Keep-alive HTTP client, created on first use"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(limits=ASR_LIMITS, timeout=60)
+        return self._client
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def transcribe(
         self,
-        audio_bytes: bytes,
+        audio_bytes: bytes | BinaryIO,
         encode: bool = True,
         task: str = "transcribe",
         language: str = "en",
     ):
-        # with open(file, "rb") as f:
-        async with httpx.AsyncClient() as client:
-            # audio_stream = io.BytesIO(audio_bytes)
-            # audio_stream.seek(0)
-            file = {
-                "audio_file": (
-                    "audio.wav",
-                    audio_bytes,
-                    "audio/wav",
-                )
-            }
-            res = await client.post(
-                url=self.api + "/asr",
-                params={
-                    "encode": str(encode).lower(),
-                    "task": task,
-                    "language": language,
-                    "output": "txt",
-                    "initial_prompt": "Transcribe the audio.",
-                },
-                # headers={"Content-Type": "multipart/form-data"},
-                files=file,
-                timeout=60,
+        """Transcribe WAV audio with the ASR service
+
+        Args:
+            audio_bytes: WAV content, or an open binary file which is
+                streamed in chunks rather than loaded into memory
+            encode: whether the service should re-encode the audio first
+            task: "transcribe" or "translate"
+            language: the spoken language
+        """
+        file = {
+            "audio_file": (
+                "audio.wav",
+                audio_bytes,
+                "audio/wav",
             )
+        }
+        res = await self.client.post(
+            url=self.api + "/asr",
+            params={
+                "encode": str(encode).lower(),
+                "task": task,
+                "language": language,
+                "output": "txt",
+                "initial_prompt": "Transcribe the audio.",
+            },
+            files=file,
+        )
         res.raise_for_status()
         return res.json()
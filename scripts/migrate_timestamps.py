@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+One-off backfill converting timestamps stored as ISO strings to BSON dates.
+
+Documents written before models were dumped in python mode stored
+created_at, updated_at, calculated_at, timestamp, etc. as ISO strings; newer
+writes store BSON dates. Until this runs, sorts on those fields (e.g.
+list_collections by created_at) order by BSON type before time, so every
+string-dated document sorts before every date-dated one, and responses mix
+"...+00:00" / naive strings with "...Z" dates.
+
+The conversion runs server-side as pipeline updates, only touches documents
+that still hold a string in one of the fields, and leaves any string that
+does not parse as a date unchanged. Naive strings are read as UTC. Safe to
+run more than once.
+
+Usage:
+    DB_URI=mongodb://... DB_NAME=gngdb python scripts/migrate_timestamps.py [--dry-run]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from pymongo import MongoClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.config.settings import DatabaseSettings  # noqa: E402
+
+ARTIFACT_FIELDS = ["created_at", "updated_at"]
+FIXITY_FIELDS = ["calculated_at", "verified_at"]
+STORAGE_LOCATION_FIELDS = ["created_at", "verified_at"]
+PRESERVATION_EVENT_FIELDS = ["timestamp"]
+COLLECTION_FIELDS = ["created_at", "uploaded_at", "verified_at", "sealed_at", "updated_at"]
+
+
+def _to_date(path: str) -> dict:
+    """Expression converting a string at path to a date, leaving other values as-is."""
+    return {
+        "$cond": [
+            {"$eq": [{"$type": path}, "string"]},
+            {"$dateFromString": {"dateString": path, "onError": path}},
+            path,
+        ]
+    }
+
+
+def _convert_object(field: str, object_fields: list[str]) -> dict:
+    """Expression converting the given fields of an embedded document."""
+    return {
+        "$cond": [
+            {"$eq": [{"$type": f"${field}"}, "object"]},
+            {
+                "$mergeObjects": [
+                    f"${field}",
+                    {name: _to_date(f"${field}.{name}") for name in object_fields},
+                ]
+            },
+            f"${field}",
+        ]
+    }
+
+
+def _convert_array(field: str, item_fields: list[str]) -> dict:
+    """Expression converting the given fields of every element of an array."""
+    return {
+        "$cond": [
+            {"$isArray": f"${field}"},
+            {
+                "$map": {
+                    "input": f"${field}",
+                    "as": "item",
+                    "in": {
+                        "$mergeObjects": [
+                            "$$item",
+                            {name: _to_date(f"$$item.{name}") for name in item_fields},
+                        ]
+                    },
+                }
+            },
+            f"${field}",
+        ]
+    }
+
+
+def _has_strings(paths: list[str]) -> dict:
+    return {"$or": [{path: {"$type": "string"}} for path in paths]}
+
+
+def migrate(db, dry_run: bool = False) -> dict[str, int]:
+    """
+    Convert string timestamps in the artifacts and collections collections.
+
+    Args:
+        db: pymongo Database
+        dry_run: Only count the documents that would be updated
+
+    Returns:
+        Number of documents matched per collection
+    """
+    artifact_query = _has_strings(
+        ARTIFACT_FIELDS
+        + [f"fixity.{name}" for name in FIXITY_FIELDS]
+        + [f"storage_locations.{name}" for name in STORAGE_LOCATION_FIELDS]
+        + [f"preservation_events.{name}" for name in PRESERVATION_EVENT_FIELDS]
+    )
+    artifact_update = [
+        {"$set": {field: _to_date(f"${field}") for field in ARTIFACT_FIELDS}},
+        {
+            "$set": {
+                "fixity": _convert_object("fixity", FIXITY_FIELDS),
+                "storage_locations": _convert_array(
+                    "storage_locations", STORAGE_LOCATION_FIELDS
+                ),
+                "preservation_events": _convert_array(
+                    "preservation_events", PRESERVATION_EVENT_FIELDS
+                ),
+            }
+        },
+    ]
+    collection_query = _has_strings(COLLECTION_FIELDS)
+    collection_update = [
+        {"$set": {field: _to_date(f"${field}") for field in COLLECTION_FIELDS}}
+    ]
+
+    if dry_run:
+        return {
+            "artifacts": db.artifacts.count_documents(artifact_query),
+            "collections": db.collections.count_documents(collection_query),
+        }
+
+    return {
+        "artifacts": db.artifacts.update_many(artifact_query, artifact_update).matched_count,
+        "collections": db.collections.update_many(
+            collection_query, collection_update
+        ).matched_count,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Only count documents to convert"
+    )
+    args = parser.parse_args()
+
+    settings = DatabaseSettings()
+    client = MongoClient(settings.uri)
+    try:
+        counts = migrate(client[settings.name], dry_run=args.dry_run)
+    finally:
+        client.close()
+
+    verb = "would convert" if args.dry_run else "converted"
+    for name, count in counts.items():
+        print(f"{name}: {verb} timestamps in {count} documents")
+
+
+if __name__ == "__main__":
+    main()
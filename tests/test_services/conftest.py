@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+
+import pytest
+from bson import ObjectId
+
+from app.services.db import Database, _ReadCache
+
+
+class FakeCollection:
+    """In-memory stand-in for a Motor collection holding one document."""
+
+    def __init__(self, doc: dict | None = None, on_read=None):
+        self.doc = doc
+        self.reads = 0
+        # Optional coroutine function awaited mid-read, to simulate work
+        # (e.g. a write) landing while a query is in flight
+        self.on_read = on_read
+
+    async def find_one(self, query, projection=None):
+        self.reads += 1
+        doc = self.doc
+        if self.on_read is not None:
+            on_read, self.on_read = self.on_read, None
+            await on_read()
+        return doc
+
+    def aggregate(self, pipeline, **kwargs):
+        self.reads += 1
+        return FakeCursor([{"events": []}] if self.doc else [])
+
+    async def insert_one(self, doc):
+        return SimpleNamespace(inserted_id=ObjectId())
+
+    async def update_one(self, query, update):
+        return SimpleNamespace(matched_count=1, modified_count=1)
+
+
+class FakeCursor:
+    def __init__(self, docs: list[dict]):
+        self.docs = docs
+
+    async def to_list(self, length=None):
+        return self.docs[:length]
+
+
+@pytest.fixture
+def fake_collection():
+    """Factory for in-memory Motor collection stand-ins."""
+    return FakeCollection
+
+
+@pytest.fixture
+def make_db():
+    """Build a Database over fake collections, without a Mongo client."""
+
+    def _make_db(artifacts=None, collections=None) -> Database:
+        db = Database.__new__(Database)
+        db.db = SimpleNamespace(
+            artifacts=artifacts or FakeCollection(),
+            collections=collections or FakeCollection(),
+        )
+        db._read_cache = _ReadCache()
+        return db
+
+    return _make_db
@@ -0,0 +1,237 @@
+from datetime import datetime, timezone
+
+import pytest
+from bson import ObjectId
+
+import app.services.db as db_module
+from app.models.collection import Collection
+from app.models.metadata import (
+    PreservationEvent,
+    PreservationEventOutcome,
+    PreservationEventType,
+    StorageLocation,
+    StorageType,
+)
+from app.services.db import _ReadCache
+
+KEY = ("artifact", "a1", None)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for TTL checks (sync tests only)."""
+    now = [1000.0]
+    monkeypatch.setattr(db_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _location() -> StorageLocation:
+    return StorageLocation(
+        storage_type=StorageType.HOT,
+        path="artifacts/a1",
+        size_bytes=1,
+        checksum_md5="md5",
+        checksum_sha256="sha256",
+    )
+
+
+def _event() -> PreservationEvent:
+    return PreservationEvent(
+        event_type=PreservationEventType.VALIDATION,
+        timestamp=datetime.now(timezone.utc),
+        agent="test",
+        outcome=PreservationEventOutcome.SUCCESS,
+    )
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = _ReadCache()
+    cache.set(KEY, {"status": "uploading"}, cache.generation(KEY))
+
+    clock[0] += db_module._READ_CACHE_TTL - 0.1
+    assert cache.get(KEY) == (True, {"status": "uploading"})
+
+    clock[0] += 0.2
+    assert cache.get(KEY) == (False, None)
+
+
+def test_terminal_documents_use_the_same_ttl(clock):
+    cache = _ReadCache()
+    cache.set(KEY, {"status": "ready"}, cache.generation(KEY))
+
+    clock[0] += db_module._READ_CACHE_TTL + 0.1
+    assert cache.get(KEY) == (False, None)
+
+
+def test_missing_documents_are_not_cached():
+    cache = _ReadCache()
+    cache.set(KEY, None, cache.generation(KEY))
+
+    assert cache.get(KEY) == (False, None)
+
+
+def test_oldest_entry_is_evicted_when_full():
+    cache = _ReadCache(maxsize=2)
+    keys = [("artifact", f"a{i}", None) for i in range(3)]
+    for key in keys:
+        cache.set(key, {}, cache.generation(key))
+
+    assert cache.get(keys[0]) == (False, None)
+    assert cache.get(keys[1])[0]
+    assert cache.get(keys[2])[0]
+    assert ("artifact", "a0") not in cache._keys_by_id
+
+
+def test_invalidate_drops_every_variant_of_a_document():
+    cache = _ReadCache()
+    variants = [("artifact", "a1", None), ("artifact", "a1", "api")]
+    other = ("artifact", "a2", None)
+    for key in (*variants, other):
+        cache.set(key, {}, cache.generation(key))
+
+    cache.invalidate("artifact", "a1")
+
+    for key in variants:
+        assert cache.get(key) == (False, None)
+    assert cache.get(other)[0]
+
+
+def test_read_started_before_invalidate_is_not_cached():
+    cache = _ReadCache()
+    generation = cache.generation(KEY)
+
+    cache.invalidate("artifact", "a1")
+    cache.set(KEY, {"status": "stale"}, generation)
+
+    assert cache.get(KEY) == (False, None)
+
+
+def test_read_started_after_invalidate_is_cached():
+    cache = _ReadCache()
+    cache.invalidate("artifact", "a1")
+
+    cache.set(KEY, {"status": "fresh"}, cache.generation(KEY))
+
+    assert cache.get(KEY) == (True, {"status": "fresh"})
+
+
+def test_generation_table_is_bounded_and_stays_safe():
+    cache = _ReadCache(maxsize=2)
+    generation = cache.generation(KEY)
+
+    cache.invalidate("artifact", "a1")
+    for i in range(2, 6):
+        cache.invalidate("artifact", f"a{i}")
+
+    assert len(cache._generations) <= 2
+    cache.set(KEY, {"status": "stale"}, generation)
+    assert cache.get(KEY) == (False, None)
+
+
+@pytest.mark.asyncio
+async def test_get_artifact_serves_repeat_reads_from_cache(make_db, fake_collection):
+    artifacts = fake_collection({"_id": ObjectId(), "status": "uploading"})
+    db = make_db(artifacts=artifacts)
+    artifact_id = str(artifacts.doc["_id"])
+
+    first = await db.get_artifact(artifact_id)
+    second = await db.get_artifact(artifact_id)
+
+    assert first is second
+    assert artifacts.reads == 1
+
+
+@pytest.mark.asyncio
+async def test_get_artifact_does_not_cache_missing_documents(make_db, fake_collection):
+    artifacts = fake_collection(None)
+    db = make_db(artifacts=artifacts)
+    artifact_id = str(ObjectId())
+
+    assert await db.get_artifact(artifact_id) is None
+    artifacts.doc = {"_id": ObjectId(artifact_id), "status": "uploading"}
+    assert await db.get_artifact(artifact_id) == artifacts.doc
+    assert artifacts.reads == 2
+
+
+@pytest.mark.asyncio
+async def test_write_during_read_does_not_leave_stale_entry(make_db, fake_collection):
+    artifact_id = str(ObjectId())
+
+    async def write():
+        # A write lands while the read is still in flight
+        await db.update_artifact(artifact_id, {"status": "ready"})
+
+    artifacts = fake_collection({"status": "uploading"}, on_read=write)
+    db = make_db(artifacts=artifacts)
+
+    await db.get_artifact(artifact_id)
+    await db.get_artifact(artifact_id)
+
+    assert artifacts.reads == 2
+
+
+ARTIFACT_WRITES = {
+    "update_artifact_status": lambda db, i: db.update_artifact_status(
+        i, db_module.ArtifactStatus.READY
+    ),
+    "add_storage_location": lambda db, i: db.add_storage_location(i, _location()),
+    "add_preservation_event": lambda db, i: db.add_preservation_event(i, _event()),
+    "add_location_and_event": lambda db, i: db.add_location_and_event(
+        i, _location(), _event()
+    ),
+    "update_storage_location_verification": (
+        lambda db, i: db.update_storage_location_verification(
+            i, StorageType.HOT, datetime.now(timezone.utc)
+        )
+    ),
+    "update_artifact": lambda db, i: db.update_artifact(i, {"title": "new"}),
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("write", ARTIFACT_WRITES.values(), ids=ARTIFACT_WRITES)
+async def test_artifact_writes_invalidate_cached_reads(make_db, fake_collection, write):
+    artifacts = fake_collection({"_id": ObjectId(), "status": "ready"})
+    db = make_db(artifacts=artifacts)
+    artifact_id = str(artifacts.doc["_id"])
+
+    await db.get_artifact(artifact_id)
+    await db.get_artifact_with_id(artifact_id)
+    await db.get_preservation_events(artifact_id)
+    reads = artifacts.reads
+
+    await write(db, artifact_id)
+
+    await db.get_artifact(artifact_id)
+    await db.get_artifact_with_id(artifact_id)
+    await db.get_preservation_events(artifact_id)
+    assert artifacts.reads == reads + 3
+
+
+COLLECTION_WRITES = {
+    "insert_collection": lambda db, i: db.insert_collection(
+        Collection(
+            collection_id=i,
+            title="Collection",
+            slug="collection",
+            globus_path="/archive/collection/",
+            globus_endpoint_id="endpoint",
+        )
+    ),
+    "update_collection": lambda db, i: db.update_collection(i, {"title": "new"}),
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("write", COLLECTION_WRITES.values(), ids=COLLECTION_WRITES)
+async def test_collection_writes_invalidate_cached_reads(
+    make_db, fake_collection, write
+):
+    collections = fake_collection({"collection_id": "c1", "status": "draft"})
+    db = make_db(collections=collections)
+
+    await db.get_collection("c1")
+    await write(db, "c1")
+    await db.get_collection("c1")
+
+    assert collections.reads == 2